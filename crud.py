@@ -3,12 +3,39 @@ CRUD operations for Reminder model.
 Provides functions to Create, Read, Update, and Delete reminders.
 """
 
+from sqlalchemy import bindparam, or_, select, update
 from sqlalchemy.orm import Session
 from models import Reminder
 from datetime import datetime
 from typing import List, Optional
 
 
+# Statements run by the scheduler every tick are built once and executed with
+# bound parameters, so they stay in SQLAlchemy's compiled-statement cache
+
+_DUE_REMINDERS_STMT = select(Reminder).where(
+    Reminder.status == bindparam("match_status"),
+    Reminder.due_date_time >= bindparam("start_time"),
+    Reminder.due_date_time <= bindparam("end_time")
+)
+
+_CLAIM_DUE_REMINDERS_STMT = (
+    update(Reminder)
+    .where(
+        Reminder.status == bindparam("match_status"),
+        Reminder.due_date_time >= bindparam("start_time"),
+        Reminder.due_date_time <= bindparam("end_time"),
+        or_(
+            Reminder.last_notified_at.is_(None),
+            Reminder.last_notified_at < bindparam("renotify_before")
+        )
+    )
+    .values(last_notified_at=bindparam("notified_at"))
+    .returning(Reminder)
+    .execution_options(synchronize_session=False)
+)
+
+
 def create_reminder(
     db: Session,
     user_id: str,
@@ -168,8 +195,38 @@ def get_due_reminders(
 ) -> List[Reminder]:
     """Get reminders due within a time range."""
     
-    return db.query(Reminder).filter(
-        Reminder.status == status,
-        Reminder.due_date_time >= start_time,
-        Reminder.due_date_time <= end_time
-    ).all()
+    return db.execute(_DUE_REMINDERS_STMT, {
+        "match_status": status,
+        "start_time": start_time,
+        "end_time": end_time
+    }).scalars().all()
+
+
+def claim_due_reminders(
+    db: Session,
+    start_time: datetime,
+    end_time: datetime,
+    status: str = "pending",
+    notified_at: Optional[datetime] = None
+) -> List[Reminder]:
+    """
+    Mark reminders due within a time range as notified and return them.
+    
+    Selecting and stamping ``last_notified_at`` happen in a single
+    ``UPDATE ... RETURNING`` statement. Reminders already notified for their
+    current due time are skipped, so overlapping scheduler windows notify
+    each reminder once. The caller is responsible for committing.
+    """
+    
+    notified_at = notified_at or datetime.now()
+    # Anything notified before this point was notified for an earlier due time
+    renotify_before = start_time - (end_time - start_time)
+    
+    return db.scalars(_CLAIM_DUE_REMINDERS_STMT, {
+        "match_status": status,
+        "start_time": start_time,
+        "end_time": end_time,
+        "renotify_before": renotify_before,
+        "notified_at": notified_at
+    }).all()
+
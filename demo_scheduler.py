@@ -3,12 +3,19 @@ Demo script for testing the Background Scheduler
 Phase 1.5: Background Scheduler demonstration
 """
 
+import logging
 import time
 from datetime import datetime, timedelta
 from database import SessionLocal, init_db
 import crud
 from scheduler import ReminderScheduler, console_notification_handler, file_notification_handler
 
+# Show scheduler log output
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
 # Initialize database
 init_db()
 
@@ -111,7 +118,7 @@ def run_scheduler_demo(duration_minutes: int = 5):
     # Add notification handlers
     scheduler.add_notification_handler(console_notification_handler)
     scheduler.add_notification_handler(
-        lambda r, m: file_notification_handler(r, m, filepath="demo_notifications.log")
+        lambda rs, ms: file_notification_handler(rs, ms, filepath="demo_notifications.log")
     )
     
     # Start scheduler (check every minute)
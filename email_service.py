@@ -10,7 +10,7 @@ import asyncio
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 import logging
 
@@ -345,13 +345,13 @@ def get_email_service() -> EmailService:
 
 
 # Notification handler for scheduler integration
-def email_notification_handler(reminder: Reminder, message: str, to_email: Optional[str] = None):
+def email_notification_handler(reminders: List[Reminder], messages: List[str], to_email: Optional[str] = None):
     """
     Email notification handler for scheduler.
     
     Args:
-        reminder: Reminder object
-        message: Formatted notification message (not used, we create our own)
+        reminders: Reminder objects due for notification
+        messages: Formatted notification messages (not used, we create our own)
         to_email: Recipient email address (defaults to env variable)
     """
     email_service = get_email_service()
@@ -367,10 +367,11 @@ def email_notification_handler(reminder: Reminder, message: str, to_email: Optio
         logger.warning("No recipient email configured for notification")
         return
     
-    # Send notification
-    success = email_service.send_reminder_notification(reminder, recipient)
-    
-    if success:
-        logger.info(f"✅ Email notification sent for reminder: {reminder.title}")
-    else:
-        logger.error(f"❌ Failed to send email notification for reminder: {reminder.title}")
+    # Send one notification per reminder
+    for reminder in reminders:
+        success = email_service.send_reminder_notification(reminder, recipient)
+        
+        if success:
+            logger.info(f"✅ Email notification sent for reminder: {reminder.title}")
+        else:
+            logger.error(f"❌ Failed to send email notification for reminder: {reminder.title}")
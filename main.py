@@ -5,12 +5,14 @@ Phase 1.3: REST API implementation
 
 from fastapi import FastAPI, HTTPException, Query, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, RedirectResponse, Response
 from fastapi.staticfiles import StaticFiles
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 from typing import Optional, List, Literal
 import os
+import orjson
 
 # Import from our modules
 from database import SessionLocal, init_db, engine
@@ -61,7 +63,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware for frontend access
@@ -77,6 +80,28 @@ app.add_middleware(
 app.mount("/ui", StaticFiles(directory="static", html=True), name="static")
 
 
+# Serializer for reminder lists (runs in pydantic-core)
+_REMINDER_LIST_ADAPTER = TypeAdapter(List[ReminderResponse])
+
+
+def reminder_list_response(reminders: list, total: int, page: int, page_size: int) -> Response:
+    """
+    Build a ReminderListResponse body directly as JSON bytes.
+    
+    The reminder list is encoded by pydantic-core and embedded into the
+    envelope by orjson, skipping FastAPI's response re-validation and
+    jsonable_encoder pass.
+    """
+    items = [ReminderResponse.model_validate(r) for r in reminders]
+    content = orjson.dumps({
+        "reminders": orjson.Fragment(_REMINDER_LIST_ADAPTER.dump_json(items)),
+        "total": total,
+        "page": page,
+        "page_size": page_size
+    })
+    return Response(content=content, media_type="application/json")
+
+
 # Dependency: Get database session
 def get_db():
     """Dependency to get database session."""
@@ -300,8 +325,8 @@ async def get_reminders(
         end = start + page_size
         paginated = reminders[start:end]
         
-        return ReminderListResponse(
-            reminders=[ReminderResponse.model_validate(r) for r in paginated],
+        return reminder_list_response(
+            paginated,
             total=total,
             page=page,
             page_size=page_size
@@ -592,8 +617,8 @@ async def get_due_reminders(
         # Filter by user_id
         user_reminders = [r for r in due_reminders if r.user_id == user_id]
         
-        return ReminderListResponse(
-            reminders=[ReminderResponse.model_validate(r) for r in user_reminders],
+        return reminder_list_response(
+            user_reminders,
             total=len(user_reminders),
             page=1,
             page_size=len(user_reminders)
@@ -4,18 +4,73 @@ Uses OpenAI's function calling to parse natural language into structured reminde
 """
 
 import os
+import re
+import copy
 import json
-from datetime import datetime
+import asyncio
+import functools
+import hashlib
+import logging
+import threading
+from datetime import datetime, timedelta
 from typing import Optional, List, Literal
-from openai import OpenAI
+from openai import AsyncOpenAI, DefaultAioHttpClient, OpenAI
+from openai.types.chat import ChatCompletion
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
+from cachetools import LRUCache
+import orjson
 
 # Load environment variables
 load_dotenv()
 
-# Initialize OpenAI client
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+logger = logging.getLogger(__name__)
+
+
+@functools.cache
+def get_client() -> OpenAI:
+    """
+    Get the OpenAI client for this process, creating it on first use.
+    
+    Creating it lazily keeps imports working without an API key and gives
+    each worker process its own connection pool.
+    """
+    return OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+
+# Models used for parsing: short single-clause inputs go to the cheaper model
+SIMPLE_MODEL = "gpt-4o-mini"
+COMPLEX_MODEL = "gpt-4o"
+_COMPLEX_INPUT_PATTERN = re.compile(
+    r"\b(every|each|weekly|daily|monthly|unless|except)\b",
+    re.IGNORECASE
+)
+
+# Parse results keyed by date, timezone and normalized input, so repeated
+# prompts on the same day skip the OpenAI round-trip
+_PARSE_CACHE = LRUCache(maxsize=1024)
+_PARSE_CACHE_LOCK = threading.Lock()
+
+# Inputs relative to the current instant ("in 2 hours") parse differently
+# within a day and are never cached
+_INSTANT_RELATIVE_PATTERN = re.compile(
+    r"\b(now|in\s+(an?|\d+)\s*(seconds?|secs?|minutes?|mins?|hours?|hrs?))\b",
+    re.IGNORECASE
+)
+
+
+# "<title> every <day|weekday> at <h>[:mm]am|pm" is parsed locally without
+# calling OpenAI; anything longer or vaguer goes to the model
+_FAST_PATH_WEEKDAYS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+_FAST_PATH_PATTERN = re.compile(
+    r"\s*(?P<title>.+?)\s+every\s+(?P<day>day|" + "|".join(_FAST_PATH_WEEKDAYS) + r")"
+    r"\s+at\s+(?P<hour>\d{1,2})(?::(?P<minute>\d{2}))?\s*(?P<meridiem>am|pm)\s*",
+    re.IGNORECASE
+)
+_FAST_PATH_PRIORITY_PATTERN = re.compile(r"\b(urgent|important|asap|critical)\b", re.IGNORECASE)
+# Leading "remind me (to)" is phrasing, not part of the title
+_FAST_PATH_TITLE_PREFIX = re.compile(r"^(please\s+)?remind\s+me\b\s*(to\b\s*)?", re.IGNORECASE)
+FAST_PATH_MODEL = "local-pattern"
 
 
 class RecurrencePattern(BaseModel):
@@ -79,10 +134,55 @@ class ParsedReminder(BaseModel):
     )
 
 
+# Invariant part of every parsing request; must not vary between calls
+_SYSTEM_PROMPT = """You are an expert reminder parsing assistant. Parse the user's natural language input into a structured reminder.
+
+The user message is preceded by the current date/time, day and user timezone; use them to resolve relative times.
+
+Guidelines:
+1. Convert relative times to absolute ISO 8601 format with timezone
+2. Detect recurring patterns from phrases like "every day", "weekly", "every Monday"
+3. Infer priority from urgency words (URGENT, ASAP, important -> high/urgent)
+4. Extract location if mentioned
+5. Generate relevant tags based on context (e.g., work, personal, health, meeting)
+6. For "tomorrow", "next week", etc., calculate the exact date/time
+7. If no specific time is mentioned, use sensible defaults:
+   - Morning: 09:00
+   - Afternoon: 14:00
+   - Evening: 18:00
+   - Night: 20:00
+8. For recurring reminders, set is_recurring to true and provide the pattern
+9. Keep the title concise (under 100 characters)
+
+Examples of relative time conversion:
+- "tomorrow at 3pm" -> tomorrow's date at 15:00:00
+- "next Monday" -> date of next Monday at 09:00:00
+- "in 2 hours" -> current time + 2 hours
+- "next week" -> 7 days from now at 09:00:00
+"""
+
+# Define tools using Pydantic model
+_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "create_reminder",
+            "description": "Create a structured reminder from natural language input",
+            "parameters": ParsedReminder.model_json_schema()
+        }
+    }
+]
+
+
+# Keys of ParsedReminder, in schema order
+_PARSED_FIELDS = tuple(ParsedReminder.model_fields)
+
+
 def parse_reminder(
     natural_input: str,
     user_timezone: str = "UTC",
-    current_time: Optional[datetime] = None
+    current_time: Optional[datetime] = None,
+    client: Optional[OpenAI] = None
 ) -> dict:
     """
     Parse natural language input into structured reminder data using OpenAI.
@@ -91,113 +191,378 @@ def parse_reminder(
         natural_input: Natural language description of the reminder
         user_timezone: User's timezone (e.g., "America/New_York")
         current_time: Current time for relative date calculations (defaults to now)
+        client: OpenAI client to use (defaults to the shared get_client())
     
     Returns:
         dict containing:
             - parsed: ParsedReminder object as dict
             - original_input: The original input text
             - confidence: Confidence score (0-1)
-            - model_used: Which OpenAI model was used
+            - model_used: Which OpenAI model was used (FAST_PATH_MODEL if parsed locally)
     
     Raises:
-        ValueError: If input is empty or API key is missing
+        ValueError: If input is empty, or the API key is missing and the input needs OpenAI
         Exception: If OpenAI API call fails
     """
     
+    # Simple recurring reminders need no model
+    fast_result = _parse_fast_path(natural_input, user_timezone, current_time)
+    if fast_result is not None:
+        return fast_result
+    
     # Validation
+    _check_input(natural_input)
+    
+    cache_key = _cache_key(natural_input, user_timezone, current_time)
+    cached = _get_cached_result(cache_key, natural_input)
+    if cached is not None:
+        return cached
+    
+    request = _build_request(natural_input, user_timezone, current_time)
+    
+    # Call OpenAI API, streaming so we can stop as soon as the arguments are complete
+    try:
+        arguments, model = _stream_tool_arguments(request, client or get_client())
+        result = _result_from_arguments(natural_input, arguments, model)
+    except Exception as e:
+        raise Exception(f"Failed to parse reminder with OpenAI: {str(e)}")
+    
+    _store_cached_result(cache_key, result)
+    return result
+
+
+class _ArgumentsBuffer:
+    """Accumulates streamed tool-call arguments and spots the closing brace."""
+    
+    def __init__(self):
+        self.parts = []
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.started = False
+    
+    def feed(self, fragment: str) -> bool:
+        """
+        Add a fragment of the arguments JSON.
+        
+        Returns:
+            True once the top-level JSON object has been closed
+        """
+        self.parts.append(fragment)
+        for char in fragment:
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char in "{[":
+                self.depth += 1
+                self.started = True
+            elif char in "}]":
+                self.depth -= 1
+                if self.started and self.depth == 0:
+                    return True
+        return False
+    
+    def text(self) -> str:
+        return "".join(self.parts)
+
+
+def _stream_tool_arguments(request: dict, client: OpenAI) -> tuple[str, str]:
+    """
+    Stream a chat completion and collect the forced tool call's arguments.
+    
+    Fragments after the arguments object closes are ignored, but the stream
+    is still read to the end: closing it early would drop the pooled
+    connection instead of reusing it. When debug logging is on, usage is
+    requested as well, so prompt-cache hits can be checked.
+    
+    Returns:
+        Tuple of (arguments JSON text, model name)
+    """
+    buffer = _ArgumentsBuffer()
+    model = request["model"]
+    want_usage = logger.isEnabledFor(logging.DEBUG)
+    if want_usage:
+        request = {**request, "stream_options": {"include_usage": True}}
+    stream = client.chat.completions.create(**request, stream=True)
+    complete = False
+    try:
+        for chunk in stream:
+            model = chunk.model or model
+            if chunk.usage is not None:
+                _log_usage(chunk.usage)
+            if complete or not chunk.choices or not chunk.choices[0].delta.tool_calls:
+                continue
+            function = chunk.choices[0].delta.tool_calls[0].function
+            if function and function.arguments and buffer.feed(function.arguments):
+                complete = True
+    finally:
+        stream.close()
+    
+    if not buffer.started:
+        raise Exception("No tool call returned from OpenAI")
+    return buffer.text(), model
+
+
+def _cache_key(
+    natural_input: str,
+    user_timezone: str,
+    current_time: Optional[datetime] = None
+) -> Optional[str]:
+    """
+    Build the parse cache key for an input.
+    
+    Returns:
+        Hex digest of date, timezone and normalized text, or None if the
+        input should not be cached
+    """
+    if _INSTANT_RELATIVE_PATTERN.search(natural_input):
+        return None
+    
+    day = (current_time or datetime.now()).date().isoformat()
+    normalized = re.sub(r"\s+", " ", natural_input.lower().strip())
+    return hashlib.blake2b(f"{day}|{user_timezone}|{normalized}".encode()).hexdigest()
+
+
+def _get_cached_result(cache_key: Optional[str], natural_input: str) -> Optional[dict]:
+    """Return a private copy of a cached parse for this input, if there is one."""
+    if cache_key is None:
+        return None
+    
+    with _PARSE_CACHE_LOCK:
+        cached = _PARSE_CACHE.get(cache_key)
+    if cached is None:
+        return None
+    
+    result = copy.deepcopy(cached)
+    result["original_input"] = natural_input
+    result["confidence"] = calculate_confidence(natural_input, result["parsed"])
+    return result
+
+
+def _store_cached_result(cache_key: Optional[str], result: dict) -> None:
+    """Remember a successful parse under its cache key."""
+    if cache_key is None:
+        return
+    
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE[cache_key] = copy.deepcopy(result)
+
+
+def select_model(natural_input: str) -> str:
+    """
+    Pick the OpenAI model for an input.
+    
+    Recurring or multi-clause inputs (more than 8 words, or words like
+    "every" or "unless") need the larger model; everything else is parsed
+    by the faster, cheaper one.
+    
+    Args:
+        natural_input: Natural language description of the reminder
+    
+    Returns:
+        Model name to send to OpenAI
+    """
+    if len(natural_input.split()) > 8 or _COMPLEX_INPUT_PATTERN.search(natural_input):
+        return COMPLEX_MODEL
+    return SIMPLE_MODEL
+
+
+def _parse_fast_path(
+    natural_input: str,
+    user_timezone: str,
+    current_time: Optional[datetime] = None
+) -> Optional[dict]:
+    """
+    Parse "<title> every <day|weekday> at <time>" without calling OpenAI.
+    
+    Args:
+        natural_input: Natural language description of the reminder
+        user_timezone: User's timezone
+        current_time: Current time for finding the first occurrence (defaults to now)
+    
+    Returns:
+        dict in the shape documented on parse_reminder, or None if the input
+        does not fit the pattern and needs the model
+    """
+    match = _FAST_PATH_PATTERN.fullmatch(natural_input or "")
+    if match is None or _FAST_PATH_PRIORITY_PATTERN.search(natural_input):
+        return None
+    
+    title = _FAST_PATH_TITLE_PREFIX.sub("", match.group("title"), count=1).strip()
+    if not title:
+        return None
+    
+    hour = int(match.group("hour"))
+    minute = int(match.group("minute") or 0)
+    if not 1 <= hour <= 12 or minute > 59:
+        return None
+    hour = hour % 12 + (12 if match.group("meridiem").lower() == "pm" else 0)
+    
+    if current_time is None:
+        current_time = datetime.now()
+    due = current_time.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    
+    day = match.group("day").lower()
+    if day == "day":
+        if due <= current_time:
+            due += timedelta(days=1)
+        recurrence = RecurrencePattern(frequency="daily")
+    else:
+        weekday = _FAST_PATH_WEEKDAYS.index(day)
+        due += timedelta(days=(weekday - current_time.weekday()) % 7)
+        if due <= current_time:
+            due += timedelta(days=7)
+        recurrence = RecurrencePattern(frequency="weekly", days_of_week=[weekday])
+    
+    parsed = ParsedReminder(
+        title=title[0].upper() + title[1:],
+        due_date_time=due.isoformat(),
+        timezone=user_timezone,
+        is_recurring=True,
+        recurrence_pattern=recurrence
+    )
+    
+    return {
+        "parsed": parsed.model_dump(),
+        "original_input": natural_input,
+        "confidence": 0.95,
+        "model_used": FAST_PATH_MODEL
+    }
+
+
+def _check_input(natural_input: str) -> None:
+    """
+    Reject input that cannot be sent to OpenAI.
+    
+    Raises:
+        ValueError: If input is empty or API key is missing
+    """
     if not natural_input or not natural_input.strip():
         raise ValueError("Natural language input cannot be empty")
     
     if not os.getenv("OPENAI_API_KEY") or os.getenv("OPENAI_API_KEY") == "sk-your-key-here":
         raise ValueError("OpenAI API key not configured. Please set OPENAI_API_KEY in .env file")
+
+
+def _build_request(
+    natural_input: str,
+    user_timezone: str,
+    current_time: Optional[datetime] = None
+) -> dict:
+    """
+    Build the chat completion request for one reminder.
     
+    Args:
+        natural_input: Natural language description of the reminder
+        user_timezone: User's timezone
+        current_time: Current time for relative date calculations (defaults to now)
+    
+    Returns:
+        Keyword arguments for chat.completions.create
+    """
     # Use provided time or current time
     if current_time is None:
         current_time = datetime.now()
     
-    # Format current time for context
-    current_time_str = current_time.strftime("%Y-%m-%d %H:%M:%S")
-    current_day = current_time.strftime("%A")
-    
-    # Create system message with context
-    system_message = f"""You are an expert reminder parsing assistant. Parse the user's natural language input into a structured reminder.
-
-Current Information:
-- Current date/time: {current_time_str}
-- Current day: {current_day}
-- User timezone: {user_timezone}
-
-Guidelines:
-1. Convert relative times to absolute ISO 8601 format with timezone
-2. Detect recurring patterns from phrases like "every day", "weekly", "every Monday"
-3. Infer priority from urgency words (URGENT, ASAP, important -> high/urgent)
-4. Extract location if mentioned
-5. Generate relevant tags based on context (e.g., work, personal, health, meeting)
-6. For "tomorrow", "next week", etc., calculate the exact date/time
-7. If no specific time is mentioned, use sensible defaults:
-   - Morning: 09:00
-   - Afternoon: 14:00
-   - Evening: 18:00
-   - Night: 20:00
-8. For recurring reminders, set is_recurring to true and provide the pattern
-9. Keep the title concise (under 100 characters)
-
-Examples of relative time conversion:
-- "tomorrow at 3pm" -> tomorrow's date at 15:00:00
-- "next Monday" -> date of next Monday at 09:00:00
-- "in 2 hours" -> current time + 2 hours
-- "next week" -> 7 days from now at 09:00:00
-"""
+    # Per-request context goes after the static system prompt, keeping the
+    # tools + system prefix identical across calls for OpenAI's prompt cache
+    context_message = (
+        "Current Information:\n"
+        f"- Current date/time: {current_time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        f"- Current day: {current_time.strftime('%A')}\n"
+        f"- User timezone: {user_timezone}"
+    )
     
     # Create messages for the API call
     messages = [
-        {"role": "system", "content": system_message},
+        {"role": "system", "content": _SYSTEM_PROMPT},
+        {"role": "system", "content": context_message},
         {"role": "user", "content": natural_input}
     ]
     
-    # Define tools using Pydantic model
-    tools = [
-        {
-            "type": "function",
-            "function": {
-                "name": "create_reminder",
-                "description": "Create a structured reminder from natural language input",
-                "parameters": ParsedReminder.model_json_schema()
-            }
-        }
-    ]
+    return {
+        "model": select_model(natural_input),
+        "messages": messages,
+        "tools": _TOOLS,
+        "tool_choice": {"type": "function", "function": {"name": "create_reminder"}},
+        "temperature": 0.1  # Lower temperature for more consistent parsing
+    }
+
+
+def _build_result(natural_input: str, response) -> dict:
+    """
+    Turn a chat completion into the parse_reminder result.
     
-    # Call OpenAI API
-    try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",  # Cost-effective model
-            messages=messages,
-            tools=tools,
-            tool_choice={"type": "function", "function": {"name": "create_reminder"}},
-            temperature=0.1  # Lower temperature for more consistent parsing
+    Args:
+        natural_input: The original input text
+        response: ChatCompletion returned by OpenAI
+    
+    Returns:
+        dict in the shape documented on parse_reminder
+    """
+    # Extract the function call
+    message = response.choices[0].message
+    
+    if not message.tool_calls:
+        raise Exception("No tool call returned from OpenAI")
+    
+    if response.usage is not None:
+        _log_usage(response.usage)
+    
+    tool_call = message.tool_calls[0]
+    return _result_from_arguments(natural_input, tool_call.function.arguments, response.model)
+
+
+def _log_usage(usage) -> None:
+    """Log prompt token usage; prompt-cache hits show up as cached tokens."""
+    if usage.prompt_tokens_details is not None:
+        logger.debug(
+            "OpenAI prompt tokens: %d (%d cached)",
+            usage.prompt_tokens, usage.prompt_tokens_details.cached_tokens or 0
         )
-        
-        # Extract the function call
-        message = response.choices[0].message
-        
-        if not message.tool_calls:
-            raise Exception("No tool call returned from OpenAI")
-        
-        tool_call = message.tool_calls[0]
-        parsed_data = json.loads(tool_call.function.arguments)
-        
-        # Calculate confidence based on how specific the input was
-        confidence = calculate_confidence(natural_input, parsed_data)
-        
-        return {
-            "parsed": parsed_data,
-            "original_input": natural_input,
-            "confidence": confidence,
-            "model_used": response.model
-        }
+
+
+def _result_from_arguments(natural_input: str, arguments: str, model: str) -> dict:
+    """Build the parse_reminder result from tool-call arguments JSON."""
+    raw = orjson.loads(arguments)
     
-    except Exception as e:
-        raise Exception(f"Failed to parse reminder with OpenAI: {str(e)}")
+    # Keep only the schema's keys so stray model output never reaches callers
+    parsed_data = {key: raw[key] for key in _PARSED_FIELDS if key in raw}
+    
+    # Calculate confidence based on how specific the input was
+    confidence = calculate_confidence(natural_input, parsed_data)
+    
+    return {
+        "parsed": parsed_data,
+        "original_input": natural_input,
+        "confidence": confidence,
+        "model_used": model
+    }
+
+
+def _keyword_pattern(*keywords: str) -> "re.Pattern":
+    """Compile keywords into one substring-matching alternation."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+# Confidence boosts, each applied once if any of its keywords appears in the input
+_CONFIDENCE_KEYWORDS = (
+    # Specific time mentions
+    (_keyword_pattern('at', 'pm', 'am', 'o\'clock', ':'), 0.15),
+    # Specific date mentions
+    (_keyword_pattern('tomorrow', 'today', 'monday', 'tuesday', 'wednesday',
+                      'thursday', 'friday', 'saturday', 'sunday', 'next week'), 0.15),
+    # Priority keywords
+    (_keyword_pattern('urgent', 'important', 'asap', 'critical'), 0.1),
+    # Recurring patterns
+    (_keyword_pattern('every', 'daily', 'weekly', 'monthly'), 0.1),
+)
 
 
 def calculate_confidence(input_text: str, parsed_data: dict) -> float:
@@ -214,27 +579,9 @@ def calculate_confidence(input_text: str, parsed_data: dict) -> float:
     confidence = 0.5  # Base confidence
     
     input_lower = input_text.lower()
-    
-    # Increase confidence for specific time mentions
-    time_keywords = ['at', 'pm', 'am', 'o\'clock', ':']
-    if any(keyword in input_lower for keyword in time_keywords):
-        confidence += 0.15
-    
-    # Increase confidence for specific date mentions
-    date_keywords = ['tomorrow', 'today', 'monday', 'tuesday', 'wednesday', 
-                     'thursday', 'friday', 'saturday', 'sunday', 'next week']
-    if any(keyword in input_lower for keyword in date_keywords):
-        confidence += 0.15
-    
-    # Increase confidence for priority keywords
-    priority_keywords = ['urgent', 'important', 'asap', 'critical']
-    if any(keyword in input_lower for keyword in priority_keywords):
-        confidence += 0.1
-    
-    # Increase confidence for recurring patterns
-    recurring_keywords = ['every', 'daily', 'weekly', 'monthly']
-    if any(keyword in input_lower for keyword in recurring_keywords):
-        confidence += 0.1
+    for keywords, boost in _CONFIDENCE_KEYWORDS:
+        if keywords.search(input_lower):
+            confidence += boost
     
     # Cap at 0.95 (never 100% certain)
     return min(confidence, 0.95)
@@ -242,34 +589,240 @@ def calculate_confidence(input_text: str, parsed_data: dict) -> float:
 
 def parse_reminder_batch(
     inputs: List[str],
-    user_timezone: str = "UTC"
+    user_timezone: str = "UTC",
+    concurrency: int = 5
 ) -> List[dict]:
     """
     Parse multiple reminders in batch.
     
+    Requests are sent concurrently, at most `concurrency` at a time, so the
+    batch takes roughly as long as its slowest input rather than the sum.
+    For use from synchronous code; async callers should await
+    parse_reminder_batch_async instead.
+    
     Args:
         inputs: List of natural language inputs
         user_timezone: User's timezone
+        concurrency: Maximum number of OpenAI requests in flight
     
     Returns:
-        List of parsed reminder results
+        List of parsed reminder results, in input order
+    
+    Raises:
+        RuntimeError: If called while an event loop is running in this thread
     """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(parse_reminder_batch_async(inputs, user_timezone, concurrency))
+    
+    raise RuntimeError(
+        "parse_reminder_batch() cannot be called from a running event loop; "
+        "await parse_reminder_batch_async() instead"
+    )
+
+
+async def parse_reminder_batch_async(
+    inputs: List[str],
+    user_timezone: str = "UTC",
+    concurrency: int = 5
+) -> List[dict]:
+    """
+    Parse multiple reminders in batch from async code.
+    
+    Args:
+        inputs: List of natural language inputs
+        user_timezone: User's timezone
+        concurrency: Maximum number of OpenAI requests in flight
+    
+    Returns:
+        List of parsed reminder results, in input order
+    """
+    outcomes = await _parse_reminder_batch_async(inputs, user_timezone, concurrency)
+    
     results = []
+    for input_text, outcome in zip(inputs, outcomes):
+        if isinstance(outcome, Exception):
+            results.append({
+                "parsed": None,
+                "original_input": input_text,
+                "error": str(outcome),
+                "confidence": 0.0
+            })
+        else:
+            results.append(outcome)
+    
+    return results
+
+
+async def _parse_reminder_batch_async(
+    inputs: List[str],
+    user_timezone: str,
+    concurrency: int
+) -> list:
+    """
+    Parse all inputs, sending the ones that need OpenAI on one AsyncOpenAI client.
+    
+    Failures are returned in place of results, not raised. The client is only
+    created if some input misses both the fast path and the parse cache.
+    """
+    current_time = datetime.now()
+    
+    # Resolve what we can locally; remember the rest as (index, input, cache key)
+    outcomes = []
+    pending = []
+    for index, input_text in enumerate(inputs):
+        try:
+            result = _parse_fast_path(input_text, user_timezone, current_time)
+            if result is None:
+                _check_input(input_text)
+                cache_key = _cache_key(input_text, user_timezone, current_time)
+                result = _get_cached_result(cache_key, input_text)
+                if result is None:
+                    pending.append((index, input_text, cache_key))
+        except Exception as e:
+            result = e
+        outcomes.append(result)
+    
+    if not pending:
+        return outcomes
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    # aiohttp holds up better than httpx's async transport under many concurrent requests
+    async with AsyncOpenAI(
+        api_key=os.getenv("OPENAI_API_KEY"),
+        http_client=DefaultAioHttpClient()
+    ) as async_client:
+        async def parse_one(input_text: str, cache_key: Optional[str]) -> dict:
+            request = _build_request(input_text, user_timezone, current_time)
+            async with semaphore:
+                try:
+                    response = await async_client.chat.completions.create(**request)
+                    result = _build_result(input_text, response)
+                except Exception as e:
+                    raise Exception(f"Failed to parse reminder with OpenAI: {str(e)}")
+            
+            _store_cached_result(cache_key, result)
+            return result
+        
+        parsed = await asyncio.gather(
+            *(parse_one(input_text, cache_key) for _, input_text, cache_key in pending),
+            return_exceptions=True
+        )
+    
+    for (index, _, _), outcome in zip(pending, parsed):
+        outcomes[index] = outcome
+    return outcomes
+
+
+def submit_batch(
+    inputs: List[str],
+    user_timezone: str = "UTC",
+    completion_window: str = "24h"
+) -> str:
+    """
+    Submit reminders to the OpenAI Batch API.
+    
+    Batch requests cost half as much as regular ones but complete
+    asynchronously, within completion_window. Use retrieve_batch to collect
+    the results.
+    
+    Args:
+        inputs: List of natural language inputs
+        user_timezone: User's timezone
+        completion_window: How long OpenAI may take to finish the batch
+    
+    Returns:
+        ID of the created batch
+    
+    Raises:
+        ValueError: If any input is empty or API key is missing
+    """
     for input_text in inputs:
+        _check_input(input_text)
+    
+    current_time = datetime.now()
+    lines = [
+        json.dumps({
+            "custom_id": str(index),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": _build_request(input_text, user_timezone, current_time)
+        })
+        for index, input_text in enumerate(inputs)
+    ]
+    
+    batch_file = get_client().files.create(
+        file=("reminders.jsonl", "\n".join(lines).encode("utf-8")),
+        purpose="batch"
+    )
+    batch = get_client().batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window=completion_window
+    )
+    return batch.id
+
+
+def retrieve_batch(batch_id: str, inputs: List[str]) -> Optional[List[dict]]:
+    """
+    Collect the results of a batch created by submit_batch.
+    
+    Args:
+        batch_id: ID returned by submit_batch
+        inputs: The inputs that were submitted, in the same order
+    
+    Returns:
+        List of parsed reminder results in the parse_reminder_batch shape,
+        or None if the batch is still running
+    
+    Raises:
+        Exception: If the batch failed, expired or was cancelled
+    """
+    batch = get_client().batches.retrieve(batch_id)
+    if batch.status in ("validating", "in_progress", "finalizing"):
+        return None
+    if batch.status != "completed":
+        raise Exception(f"OpenAI batch {batch_id} ended with status: {batch.status}")
+    
+    # Requests that failed outright appear only in the error file
+    outcomes = {}
+    for file_id in (batch.output_file_id, batch.error_file_id):
+        if not file_id:
+            continue
+        for line in get_client().files.content(file_id).text.splitlines():
+            if line.strip():
+                record = json.loads(line)
+                outcomes[int(record["custom_id"])] = record
+    
+    results = []
+    for index, input_text in enumerate(inputs):
+        record = outcomes.get(index)
         try:
-            result = parse_reminder(input_text, user_timezone)
-            results.append(result)
+            if record is None:
+                raise Exception("No result returned for this input")
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                raise Exception(str(record.get("error") or response.get("body")))
+            results.append(_build_result(input_text, ChatCompletion.model_validate(response["body"])))
         except Exception as e:
             results.append({
                 "parsed": None,
                 "original_input": input_text,
-                "error": str(e),
+                "error": f"Failed to parse reminder with OpenAI: {str(e)}",
                 "confidence": 0.0
             })
     
     return results
 
 
+# Allowed priorities, in display order, plus a set for membership checks
+_VALID_PRIORITIES = ('low', 'medium', 'high', 'urgent')
+_VALID_PRIORITY_SET = frozenset(_VALID_PRIORITIES)
+_INVALID_PRIORITY_ERROR = f"Priority must be one of: {', '.join(_VALID_PRIORITIES)}"
+
+
 def validate_parsed_reminder(parsed_data: dict) -> tuple[bool, Optional[str]]:
     """
     Validate parsed reminder data.
@@ -290,14 +843,13 @@ def validate_parsed_reminder(parsed_data: dict) -> tuple[bool, Optional[str]]:
         
         # Validate due_date_time is ISO 8601 format
         try:
-            datetime.fromisoformat(parsed_data["due_date_time"].replace('Z', '+00:00'))
+            datetime.fromisoformat(parsed_data["due_date_time"])
         except ValueError:
             return False, "Invalid due_date_time format (must be ISO 8601)"
         
         # Validate priority
-        valid_priorities = ['low', 'medium', 'high', 'urgent']
-        if parsed_data.get("priority") and parsed_data["priority"] not in valid_priorities:
-            return False, f"Priority must be one of: {', '.join(valid_priorities)}"
+        if parsed_data.get("priority") and parsed_data["priority"] not in _VALID_PRIORITY_SET:
+            return False, _INVALID_PRIORITY_ERROR
         
         # Validate recurrence pattern if recurring
         if parsed_data.get("is_recurring") and not parsed_data.get("recurrence_pattern"):
@@ -2,11 +2,18 @@
 Quick automated test for the scheduler
 """
 
+import logging
 from datetime import datetime, timedelta
 from database import SessionLocal, init_db
 import crud
 from scheduler import ReminderScheduler, console_notification_handler
 
+# Show scheduler log output
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
 # Initialize database
 init_db()
 
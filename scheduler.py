@@ -5,20 +5,59 @@ Phase 1.5: Background Scheduler implementation
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Optional, Callable
+from typing import Dict, List, Callable, Tuple
+import atexit
+import functools
 import logging
+import os
+import threading
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from cachetools import TTLCache
 
 from database import SessionLocal
 import crud
 from models import Reminder
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Logging is configured by the application entry point; only set our level here
 logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Maximum number of reminders handed to notification handlers per call
+NOTIFICATION_BATCH_SIZE = 100
+
+# Per-destination HTTP sessions for webhook delivery (keep-alive connection pooling)
+_WEBHOOK_SESSIONS: Dict[str, requests.Session] = {}
+_WEBHOOK_SESSIONS_LOCK = threading.Lock()
+
+
+def _new_webhook_session() -> requests.Session:
+    """Create an HTTP session with its own connection pool and quick retries."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.1)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _get_webhook_session(webhook_url: str) -> requests.Session:
+    """Get or create the session dedicated to a webhook URL."""
+    session = _WEBHOOK_SESSIONS.get(webhook_url)
+    if session is None:
+        with _WEBHOOK_SESSIONS_LOCK:
+            session = _WEBHOOK_SESSIONS.get(webhook_url)
+            if session is None:
+                session = _WEBHOOK_SESSIONS[webhook_url] = _new_webhook_session()
+    return session
 
 
 class ReminderScheduler:
@@ -35,7 +74,13 @@ class ReminderScheduler:
     def __init__(self):
         """Initialize the scheduler."""
         self.scheduler = BackgroundScheduler()
+        # Handlers are network-bound (webhooks, SMTP), so run them concurrently
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="notification")
         self.notification_handlers: List[Callable] = []
+        # Immutable snapshot of notification_handlers iterated on the hot path
+        self._handlers: Tuple[Callable, ...] = ()
+        # reminder.id -> due_date_time it was last notified for
+        self._recently_notified = TTLCache(maxsize=10000, ttl=600)
         self.is_running = False
         
     def add_notification_handler(self, handler: Callable):
@@ -43,69 +88,99 @@ class ReminderScheduler:
         Add a notification handler function.
         
         Args:
-            handler: Function that takes (reminder, message) as arguments
+            handler: Function that takes (reminders, messages) lists as arguments
         """
         self.notification_handlers.append(handler)
-        logger.info(f"Added notification handler: {handler.__name__}")
+        self._handlers = tuple(self.notification_handlers)
+        logger.info("Added notification handler: %s", handler.__name__)
         
     def check_due_reminders(self):
         """
         Check for reminders that are due and send notifications.
         
         This method:
-        1. Queries the database for reminders due in the next 5 minutes
-        2. Filters out already-notified reminders
-        3. Sends notifications via registered handlers
+        1. Claims reminders due in the next 5 minutes that have not been
+           notified yet (one UPDATE ... RETURNING, committed once per tick)
+        2. Skips reminders this process already notified for the same due time
+        3. Sends notifications via registered handlers in batches
         """
-        db = SessionLocal()
+        # Claimed rows are used after the commit, so don't expire them
+        db = SessionLocal(expire_on_commit=False)
         try:
             # Get current time and 5-minute window
             now = datetime.now()
             future_window = now + timedelta(minutes=5)
             
-            # Query due reminders (pending status, due within 5 minutes)
-            due_reminders = crud.get_due_reminders(
+            # Claim due reminders (pending status, due within 5 minutes)
+            due_reminders = crud.claim_due_reminders(
                 db=db,
                 start_time=now,
                 end_time=future_window,
-                status="pending"
+                status="pending",
+                notified_at=now
             )
+            db.commit()
+            
+            recent = self._recently_notified
+            due_reminders = [r for r in due_reminders if recent.get(r.id) != r.due_date_time]
             
             if due_reminders:
-                logger.info(f"Found {len(due_reminders)} due reminder(s)")
+                logger.info("Found %d due reminder(s)", len(due_reminders))
+                for i in range(0, len(due_reminders), NOTIFICATION_BATCH_SIZE):
+                    batch = due_reminders[i:i + NOTIFICATION_BATCH_SIZE]
+                    self._process_reminders(batch)
+                    for reminder in batch:
+                        recent[reminder.id] = reminder.due_date_time
                 
-                for reminder in due_reminders:
-                    self._process_reminder(reminder)
+                # Write out what file handlers buffered during this tick
+                flush_notification_logs()
             
         except Exception as e:
-            logger.error(f"Error checking due reminders: {e}")
+            db.rollback()
+            logger.error("Error checking due reminders: %s", e)
         finally:
             db.close()
     
-    def _process_reminder(self, reminder: Reminder):
+    def _process_reminders(self, reminders: List[Reminder]):
         """
-        Process a single due reminder and send notifications.
+        Process a batch of due reminders and send notifications.
+        
+        Each handler is invoked once with the whole batch rather than once
+        per reminder, so N due reminders cost one call per handler. Handlers
+        run concurrently, so a batch takes as long as the slowest handler.
         
         Args:
-            reminder: The Reminder object to process
+            reminders: The Reminder objects to process
         """
         try:
-            # Format notification message
-            message = self._format_notification_message(reminder)
+            # Format all notification messages up front
+            messages = [self._format_notification_message(r) for r in reminders]
             
             # Send via all registered handlers
-            if self.notification_handlers:
-                for handler in self.notification_handlers:
+            handlers = self._handlers
+            log_error = logger.error
+            if not handlers:
+                # Default: log to console
+                for message in messages:
+                    logger.info("📢 REMINDER: %s", message)
+            elif len(handlers) == 1:
+                # Single handler: call it directly, no thread pool round-trip
+                handler = handlers[0]
+                try:
+                    handler(reminders, messages)
+                except Exception as e:
+                    log_error("Notification handler %s failed: %s", handler.__name__, e)
+            else:
+                submit = self._executor.submit
+                futures = [(handler, submit(handler, reminders, messages)) for handler in handlers]
+                for handler, future in futures:
                     try:
-                        handler(reminder, message)
+                        future.result()
                     except Exception as e:
-                        logger.error(f"Notification handler {handler.__name__} failed: {e}")
-            else:
-                # Default: log to console
-                logger.info(f"📢 REMINDER: {message}")
+                        log_error("Notification handler %s failed: %s", handler.__name__, e)
                 
         except Exception as e:
-            logger.error(f"Error processing reminder {reminder.id}: {e}")
+            logger.error("Error processing %d reminder(s): %s", len(reminders), e)
     
     def _format_notification_message(self, reminder: Reminder) -> str:
         """
@@ -117,26 +192,15 @@ class ReminderScheduler:
         Returns:
             Formatted notification string
         """
-        due_str = reminder.due_date_time.strftime("%Y-%m-%d %H:%M") if reminder.due_date_time else "No due date"
-        
-        message_parts = [
-            f"🔔 REMINDER: {reminder.title}",
-            f"📅 Due: {due_str}",
-        ]
-        
-        if reminder.description:
-            message_parts.append(f"📝 {reminder.description}")
-            
-        if reminder.priority == "high":
-            message_parts.insert(0, "🚨 HIGH PRIORITY")
-            
-        if reminder.location:
-            message_parts.append(f"📍 Location: {reminder.location}")
-            
-        if reminder.tags:
-            message_parts.append(f"🏷️ Tags: {', '.join(reminder.tags)}")
-            
-        return " | ".join(message_parts)
+        due = reminder.due_date_time
+        due_str = due.isoformat(sep=" ", timespec="minutes") if due else "No due date"
+        return (
+            f"{'🚨 HIGH PRIORITY | ' if reminder.priority == 'high' else ''}"
+            f"🔔 REMINDER: {reminder.title} | 📅 Due: {due_str}"
+            f"{' | 📝 ' + reminder.description if reminder.description else ''}"
+            f"{' | 📍 Location: ' + reminder.location if reminder.location else ''}"
+            f"{' | 🏷️ Tags: ' + ', '.join(reminder.tags) if reminder.tags else ''}"
+        )
     
     def start(self, check_interval_minutes: int = 1):
         """
@@ -149,6 +213,10 @@ class ReminderScheduler:
             logger.warning("Scheduler is already running")
             return
         
+        self._recently_notified.clear()
+        # stop() shuts the handler pool down, so a restarted scheduler needs a new one
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="notification")
+        
         # Add job to check reminders every X minutes
         self.scheduler.add_job(
             func=self.check_due_reminders,
@@ -161,7 +229,7 @@ class ReminderScheduler:
         # Start the scheduler
         self.scheduler.start()
         self.is_running = True
-        logger.info(f"✅ Scheduler started (checking every {check_interval_minutes} minute(s))")
+        logger.info("✅ Scheduler started (checking every %d minute(s))", check_interval_minutes)
         
     def stop(self):
         """Stop the scheduler."""
@@ -170,6 +238,9 @@ class ReminderScheduler:
             return
         
         self.scheduler.shutdown()
+        # Let in-flight handler calls finish, then release the pool's threads
+        self._executor.shutdown(wait=True)
+        flush_notification_logs()
         self.is_running = False
         logger.info("🛑 Scheduler stopped")
     
@@ -180,79 +251,140 @@ class ReminderScheduler:
 
 # Notification Handlers
 
-def console_notification_handler(reminder: Reminder, message: str):
+class _NotificationLog:
     """
-    Print notification to console.
+    Long-lived, buffered append handle for a notification log file.
+    
+    Writes are buffered in memory and flushed at the end of each scheduler
+    tick that sent notifications, on stop and at interpreter exit, instead of
+    opening and closing the file for every notification.
+    """
+    
+    def __init__(self, filepath: str):
+        self._fh = open(filepath, "a", buffering=64 * 1024, encoding="utf-8")
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+    
+    def write(self, lines: List[str]):
+        with self._lock:
+            self._fh.writelines(lines)
+    
+    def flush(self):
+        with self._lock:
+            if not self._fh.closed:
+                self._fh.flush()
+    
+    def close(self):
+        with self._lock:
+            if not self._fh.closed:
+                self._fh.close()
+
+
+_notification_logs: Dict[str, _NotificationLog] = {}
+_notification_logs_lock = threading.Lock()
+
+
+def _get_notification_log(filepath: str) -> _NotificationLog:
+    """Get or open the shared buffered log for a file path."""
+    key = os.path.abspath(filepath)
+    log = _notification_logs.get(key)
+    if log is None:
+        with _notification_logs_lock:
+            log = _notification_logs.get(key)
+            if log is None:
+                log = _notification_logs[key] = _NotificationLog(key)
+    return log
+
+
+def flush_notification_logs():
+    """Flush all open notification log files to disk."""
+    for log in list(_notification_logs.values()):
+        log.flush()
+
+
+def console_notification_handler(reminders: List[Reminder], messages: List[str]):
+    """
+    Print notifications to console.
     
     Args:
-        reminder: The Reminder object
-        message: Formatted notification message
+        reminders: The Reminder objects
+        messages: Formatted notification messages (one per reminder)
     """
-    print("\n" + "="*80)
-    print(message)
-    print("="*80 + "\n")
+    separator = "=" * 80
+    print("".join(f"\n{separator}\n{message}\n{separator}\n\n" for message in messages), end="")
 
 
-def file_notification_handler(reminder: Reminder, message: str, filepath: str = "notifications.log"):
+def file_notification_handler(reminders: List[Reminder], messages: List[str], filepath: str = "notifications.log"):
     """
-    Append notification to a file.
+    Append notifications to a file.
+    
+    Lines are buffered and reach disk at the end of the scheduler tick
+    (see ``flush_notification_logs``).
     
     Args:
-        reminder: The Reminder object
-        message: Formatted notification message
+        reminders: The Reminder objects
+        messages: Formatted notification messages (one per reminder)
         filepath: Path to log file (default: notifications.log)
     """
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(filepath, "a", encoding="utf-8") as f:
-        f.write(f"[{timestamp}] {message}\n")
+    _get_notification_log(filepath).write([f"[{timestamp}] {message}\n" for message in messages])
 
 
-def webhook_notification_handler(reminder: Reminder, message: str, webhook_url: str):
+def webhook_notification_handler(reminders: List[Reminder], messages: List[str], webhook_url: str):
     """
-    Send notification to a webhook endpoint.
+    Send notifications to a webhook endpoint.
+    
+    All reminders in the batch are delivered in a single POST as
+    ``{"notifications": [...]}``.
     
     Args:
-        reminder: The Reminder object
-        message: Formatted notification message
-        webhook_url: URL to POST notification to
+        reminders: The Reminder objects
+        messages: Formatted notification messages (one per reminder)
+        webhook_url: URL to POST notifications to
     """
-    import requests
-    
+    timestamp = datetime.now()
     payload = {
-        "reminder_id": reminder.id,
-        "title": reminder.title,
-        "description": reminder.description,
-        "due_date_time": reminder.due_date_time.isoformat() if reminder.due_date_time else None,
-        "priority": reminder.priority,
-        "tags": reminder.tags,
-        "location": reminder.location,
-        "message": message,
-        "timestamp": datetime.now().isoformat()
+        "notifications": [
+            {
+                "reminder_id": reminder.id,
+                "title": reminder.title,
+                "description": reminder.description,
+                "due_date_time": reminder.due_date_time,
+                "priority": reminder.priority,
+                "tags": reminder.tags,
+                "location": reminder.location,
+                "message": message,
+                "timestamp": timestamp
+            }
+            for reminder, message in zip(reminders, messages)
+        ]
     }
     
     try:
-        response = requests.post(webhook_url, json=payload, timeout=5)
+        # orjson encodes the datetime fields natively (ISO 8601)
+        response = _get_webhook_session(webhook_url).post(
+            webhook_url,
+            data=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=(2, 5)
+        )
         response.raise_for_status()
-        logger.info(f"Webhook notification sent for reminder {reminder.id}")
+        logger.info("Webhook notification sent for %d reminder(s)", len(reminders))
     except Exception as e:
-        logger.error(f"Failed to send webhook notification: {e}")
-
-
-# Global scheduler instance
-_scheduler_instance: Optional[ReminderScheduler] = None
+        logger.error("Failed to send webhook notification: %s", e)
 
 
+@functools.cache
 def get_scheduler() -> ReminderScheduler:
     """
     Get or create the global scheduler instance.
     
+    Use ``get_scheduler.cache_clear()`` to drop the instance (e.g. in tests).
+    
     Returns:
         ReminderScheduler instance
     """
-    global _scheduler_instance
-    if _scheduler_instance is None:
-        _scheduler_instance = ReminderScheduler()
-    return _scheduler_instance
+    return ReminderScheduler()
 
 
 def setup_default_scheduler(check_interval_minutes: int = 1, enable_email: bool = True) -> ReminderScheduler:
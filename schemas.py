@@ -3,9 +3,18 @@ Pydantic schemas for API request/response validation.
 These define the structure of data sent to and received from the API.
 """
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, field_validator
 from typing import Optional, List, Literal
 from datetime import datetime
+import threading
+
+from cachetools import TTLCache
+
+
+# Validated ReminderResponse objects keyed by (id, updated_at), so rows that
+# have not changed since they were last served skip revalidation
+_RESPONSE_CACHE = TTLCache(maxsize=4096, ttl=60)
+_RESPONSE_CACHE_LOCK = threading.Lock()
 
 
 # Request Schemas
@@ -91,13 +100,29 @@ class ReminderResponse(BaseModel):
     
     model_config = ConfigDict(from_attributes=True)
     
+    @field_validator("ai_confidence", mode="before")
+    @classmethod
+    def scale_ai_confidence(cls, value):
+        """Convert ai_confidence from integer percentage (0-100) to float (0.0-1.0)."""
+        if value is not None and value > 1:
+            return value / 100.0
+        return value
+    
     @classmethod
     def model_validate(cls, obj, *args, **kwargs):
-        """Override to convert ai_confidence from integer (0-100) to float (0.0-1.0)."""
-        instance = super().model_validate(obj, *args, **kwargs)
-        # Convert integer percentage (0-100) to float (0.0-1.0)
-        if instance.ai_confidence is not None and instance.ai_confidence > 1:
-            instance.ai_confidence = instance.ai_confidence / 100.0
+        """Override to reuse cached responses for unchanged ORM objects."""
+        reminder_id = getattr(obj, "id", None)
+        updated_at = getattr(obj, "updated_at", None)
+        if reminder_id is None or updated_at is None or args or kwargs:
+            return super().model_validate(obj, *args, **kwargs)
+        
+        key = (reminder_id, updated_at)
+        with _RESPONSE_CACHE_LOCK:
+            instance = _RESPONSE_CACHE.get(key)
+        if instance is None:
+            instance = super().model_validate(obj)
+            with _RESPONSE_CACHE_LOCK:
+                _RESPONSE_CACHE[key] = instance
         return instance
 
 
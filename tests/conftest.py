@@ -0,0 +1,85 @@
+"""
+Shared pytest fixtures and hooks.
+Gives each xdist worker its own SQLite database and shares the SQLite
+engine setup used by the database-backed test modules.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Tune a new test SQLite connection for frequent small commits.
+
+    WAL with synchronous=NORMAL avoids an fsync per commit; temp tables and
+    a 64MB page cache are kept in memory. Test data is disposable, so the
+    weaker durability does not matter here.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.close()
+
+
+def configure_savepoint_engine(engine):
+    """
+    Let SQLAlchemy control transactions on a test engine so per-test
+    SAVEPOINTs nest properly (pysqlite's implicit transaction handling
+    otherwise commits on RELEASE).
+    """
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
+def _worker_database_path(config):
+    """Path of the SQLite file owned by this xdist worker (or the main process)."""
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    return config.rootpath / f"test_{worker}.db"
+
+
+def pytest_configure(config):
+    """
+    Point DATABASE_URL at a per-worker SQLite file.
+
+    Runs before any test module imports database, so workers never contend
+    for the lock on a shared reminders.db.
+    """
+    config._previous_database_url = os.environ.get("DATABASE_URL")
+    os.environ["DATABASE_URL"] = f"sqlite:///{_worker_database_path(config)}"
+
+
+def pytest_unconfigure(config):
+    """Delete this worker's database file and restore DATABASE_URL."""
+    path = _worker_database_path(config)
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{path}{suffix}").unlink(missing_ok=True)
+
+    previous_url = getattr(config, "_previous_database_url", None)
+    if previous_url is None:
+        os.environ.pop("DATABASE_URL", None)
+    else:
+        os.environ["DATABASE_URL"] = previous_url
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked openai before any fixture runs when no key is set."""
+    api_key = os.getenv("OPENAI_API_KEY")
+    if api_key and api_key != "sk-your-key-here":
+        return
+
+    skip_openai = pytest.mark.skip(reason="OpenAI API key not available - skipping OpenAI tests")
+    for item in items:
+        if item.get_closest_marker("openai"):
+            item.add_marker(skip_openai)
+
@@ -3,66 +3,231 @@ Integration tests for REST API
 Tests all endpoints with various scenarios
 """
 
+import functools
+import json
+import re
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
-from datetime import datetime
-import os
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex, CreateTable
+from datetime import datetime, timedelta
+from types import MappingProxyType
 
 # Import app and dependencies
+import main
 from main import app, get_db
-from models import Base
+from models import Base, Reminder
+from schemas import ParseOnlyResponse
+from openai_service import ParsedReminder, RecurrencePattern, calculate_confidence
 from database import SessionLocal
-
-# Create test database
-TEST_DATABASE_URL = "sqlite:///./test_reminders.db"
-test_engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
+from tests.conftest import configure_savepoint_engine, set_sqlite_pragmas
+
+# Create test database (named shared-cache in-memory DB; StaticPool hands every
+# session the same connection, so override_get_db checkouts never reopen it)
+TEST_DATABASE_URL = "sqlite+pysqlite:///file:testdb?mode=memory&cache=shared&uri=true"
+test_engine = create_engine(
+    TEST_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
 TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
 
-# Create test client
-client = TestClient(app)
+event.listen(test_engine, "connect", set_sqlite_pragmas)
+configure_savepoint_engine(test_engine)
+
 
 # Test user ID
 TEST_USER_ID = "test_user_123"
 
+# Sample reminder payload, frozen and pre-serialized once for every POST
+_SAMPLE_REMINDER = MappingProxyType({
+    "natural_input": "Call mom tomorrow at 3pm",
+    "user_id": TEST_USER_ID,
+    "user_timezone": "America/New_York"
+})
+_SAMPLE_BODY = json.dumps(dict(_SAMPLE_REMINDER))
+_JSON_HEADERS = {"content-type": "application/json"}
 
-def override_get_db():
-    """Override database dependency for testing."""
-    try:
-        db = TestSessionLocal()
-        yield db
-    finally:
-        db.close()
+# Reminder ID that never exists, for the 404 tests
+_MISSING_ID = "00000000-0000-0000-0000-000000000000"
+_MISSING_URL = f"/reminders/{_MISSING_ID}"
+_MISSING_COMPLETE_URL = f"{_MISSING_URL}/complete"
 
 
-# Override database dependency
-app.dependency_overrides[get_db] = override_get_db
+# Schema DDL compiled once, so setup is a single executescript call
+_DDL_SCRIPT = ";\n".join(
+    str(ddl.compile(dialect=test_engine.dialect)).strip()
+    for table in Base.metadata.sorted_tables
+    for ddl in (CreateTable(table), *(CreateIndex(index) for index in sorted(table.indexes, key=lambda i: i.name)))
+) + ";"
 
 
-@pytest.fixture(scope="function", autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def setup_database():
-    """Setup test database before each test."""
-    # Create tables
-    Base.metadata.create_all(bind=test_engine)
+    """Create the test schema once for the whole session."""
+    with test_engine.connect() as connection:
+        connection.connection.driver_connection.executescript(_DDL_SCRIPT)
     yield
-    # Drop tables after test
     Base.metadata.drop_all(bind=test_engine)
 
 
+@pytest.fixture(autouse=True)
+def db_connection(setup_database):
+    """
+    Run each test inside an outer transaction that is rolled back afterwards.
+    
+    Sessions handed to the app are bound to this connection and turn their
+    commits into SAVEPOINT releases, so nothing a test writes outlives it.
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    
+    def override_get_db():
+        """Override database dependency for testing."""
+        db = TestSessionLocal(bind=connection, join_transaction_mode="create_savepoint")
+        try:
+            yield db
+        finally:
+            db.close()
+    
+    app.dependency_overrides[get_db] = override_get_db
+    yield connection
+    app.dependency_overrides.pop(get_db, None)
+    transaction.rollback()
+    connection.close()
+
+
 @pytest.fixture
-def sample_reminder_data():
-    """Sample reminder data for testing."""
+def db(db_connection):
+    """Session on the test connection for seeding rows directly."""
+    session = TestSessionLocal(
+        bind=db_connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    )
+    yield session
+    session.close()
+
+
+def _seed(db, n, **overrides):
+    """
+    Insert n reminders for TEST_USER_ID in one commit, bypassing the parser.
+    
+    Args:
+        db: Session bound to the test connection
+        n: Number of reminders to create
+        **overrides: Column values to apply to every reminder
+    
+    Returns:
+        List of created Reminder objects
+    """
+    due = datetime.utcnow() + timedelta(days=1)
+    reminders = [
+        Reminder(**{
+            "user_id": TEST_USER_ID,
+            "title": f"Seeded reminder {i + 1}",
+            "due_date_time": due + timedelta(hours=i),
+            "timezone": "America/New_York",
+            "priority": "medium",
+            "tags": [],
+            "natural_language_input": f"Seeded reminder {i + 1} tomorrow",
+            "parsed_by_ai": True,
+            "ai_confidence": 85,
+            **overrides,
+        })
+        for i in range(n)
+    ]
+    db.add_all(reminders)
+    db.commit()
+    return reminders
+
+
+# Keyword rules for the parser stub
+_URGENT_PATTERN = re.compile(r"\b(urgent|asap)\b", re.IGNORECASE)
+_RECURRING_PATTERN = re.compile(r"\bevery\s+(\w+)", re.IGNORECASE)
+_LOCATION_PATTERN = re.compile(r"\bat ((?:[A-Z]\w*\s?)+)")
+_TITLE_END_PATTERN = re.compile(r"\s+(?:today|tomorrow|yesterday|every|at|by|on)\b", re.IGNORECASE)
+
+
+def _stub_parse_reminder(natural_input, user_timezone="UTC", current_time=None):
+    """
+    Deterministic stand-in for openai_service.parse_reminder.
+    
+    Picks priority, recurrence and location out of the input with keyword
+    rules and returns the same result shape as the real parser.
+    """
+    if not natural_input or not natural_input.strip():
+        raise ValueError("Natural language input cannot be empty")
+    
+    now = (current_time or datetime.now()).replace(second=0, microsecond=0)
+    text = re.sub(r"^\s*(urgent|asap)\s*:?\s*", "", natural_input, flags=re.IGNORECASE)
+    days_ahead = -1 if "yesterday" in text.lower() else 1
+    
+    recurring = _RECURRING_PATTERN.search(text)
+    location = _LOCATION_PATTERN.search(text)
+    parsed = ParsedReminder(
+        title=_TITLE_END_PATTERN.split(text, 1)[0].strip() or text.strip(),
+        due_date_time=(now + timedelta(days=days_ahead)).isoformat(),
+        timezone=user_timezone,
+        is_recurring=recurring is not None,
+        recurrence_pattern=RecurrencePattern(
+            frequency="daily" if recurring.group(1).lower() == "day" else "weekly"
+        ) if recurring else None,
+        priority="urgent" if _URGENT_PATTERN.search(natural_input) else "medium",
+        location=location.group(1).strip() if location else None,
+    ).model_dump()
+    
     return {
-        "natural_input": "Call mom tomorrow at 3pm",
-        "user_id": TEST_USER_ID,
-        "user_timezone": "America/New_York"
+        "parsed": parsed,
+        "original_input": natural_input,
+        "confidence": calculate_confidence(natural_input, parsed),
+        "model_used": "stub"
     }
 
 
+@pytest.fixture(scope="module", autouse=True)
+def stub_parser():
+    """Serve every parse in this module from the keyword stub, not OpenAI."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(main, "parse_reminder", _stub_parse_reminder)
+        yield
+
+
+class _CachingTestClient(TestClient):
+    """TestClient whose responses decode their JSON body at most once."""
+    
+    def request(self, *args, **kwargs):
+        response = super().request(*args, **kwargs)
+        response.json = functools.cache(response.json)
+        return response
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Test client shared by the whole session; lifespan runs once."""
+    with _CachingTestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="module")
+def sample_reminder_data():
+    """Sample reminder data for testing (read-only)."""
+    return _SAMPLE_REMINDER
+
+
+@pytest.fixture
+def created_reminder(client):
+    """Reminder created through the API from the sample payload."""
+    response = client.post("/reminders", content=_SAMPLE_BODY, headers=_JSON_HEADERS)
+    assert response.status_code == 201
+    return response.json()["reminder"]
+
+
 # Test Root and Health Endpoints
 
-def test_root_endpoint():
+def test_root_endpoint(client):
     """Test root endpoint."""
     response = client.get("/")
     assert response.status_code == 200
@@ -72,7 +237,7 @@ def test_root_endpoint():
     assert "endpoints" in data
 
 
-def test_health_check():
+def test_health_check(client):
     """Test health check endpoint."""
     response = client.get("/health")
     assert response.status_code == 200
@@ -85,7 +250,7 @@ def test_health_check():
 
 # Test Parse Only Endpoint
 
-def test_parse_only_simple():
+def test_parse_only_simple(client):
     """Test parsing simple reminder without saving."""
     response = client.post(
         "/reminders/parse",
@@ -95,15 +260,13 @@ def test_parse_only_simple():
         }
     )
     assert response.status_code == 200
-    data = response.json()
-    assert "parsed" in data
-    assert "confidence" in data
-    assert "validation" in data
-    assert data["parsed"]["title"] is not None
-    assert data["validation"]["is_valid"] is True
+    result = ParseOnlyResponse.model_validate(response.json())
+    parsed = ParsedReminder.model_validate(result.parsed)
+    assert parsed.title is not None
+    assert result.validation["is_valid"] is True
 
 
-def test_parse_only_recurring():
+def test_parse_only_recurring(client):
     """Test parsing recurring reminder."""
     response = client.post(
         "/reminders/parse",
@@ -113,12 +276,12 @@ def test_parse_only_recurring():
         }
     )
     assert response.status_code == 200
-    data = response.json()
-    assert data["parsed"]["is_recurring"] is True
-    assert "recurrence_pattern" in data["parsed"]
+    parsed = ParsedReminder.model_validate(ParseOnlyResponse.model_validate(response.json()).parsed)
+    assert parsed.is_recurring is True
+    assert parsed.recurrence_pattern is not None
 
 
-def test_parse_only_urgent():
+def test_parse_only_urgent(client):
     """Test parsing urgent reminder."""
     response = client.post(
         "/reminders/parse",
@@ -128,23 +291,22 @@ def test_parse_only_urgent():
         }
     )
     assert response.status_code == 200
-    data = response.json()
-    assert data["parsed"]["priority"] in ["urgent", "high"]
+    parsed = ParsedReminder.model_validate(ParseOnlyResponse.model_validate(response.json()).parsed)
+    assert parsed.priority in ["urgent", "high"]
 
 
 # Test Create Reminder
 
-@pytest.mark.skipif(not os.getenv("OPENAI_API_KEY"), reason="OpenAI API key not available")
-def test_create_reminder_simple(sample_reminder_data):
+def test_create_reminder_simple(client, sample_reminder_data):
     """Test creating a simple reminder."""
-    response = client.post("/reminders", json=sample_reminder_data)
+    response = client.post("/reminders", content=_SAMPLE_BODY, headers=_JSON_HEADERS)
     assert response.status_code == 201
     data = response.json()
     assert "reminder" in data
     assert "parsing_details" in data
     
     reminder = data["reminder"]
-    assert reminder["user_id"] == TEST_USER_ID
+    assert reminder["user_id"] == sample_reminder_data["user_id"]
     assert reminder["title"] is not None
     assert reminder["status"] == "pending"
     assert reminder["parsed_by_ai"] is True
@@ -154,8 +316,7 @@ def test_create_reminder_simple(sample_reminder_data):
     assert "model" in parsing
 
 
-@pytest.mark.skipif(not os.getenv("OPENAI_API_KEY"), reason="OpenAI API key not available")
-def test_create_reminder_recurring():
+def test_create_reminder_recurring(client):
     """Test creating recurring reminder."""
     response = client.post(
         "/reminders",
@@ -172,8 +333,7 @@ def test_create_reminder_recurring():
     assert reminder["recurrence_pattern"] is not None
 
 
-@pytest.mark.skipif(not os.getenv("OPENAI_API_KEY"), reason="OpenAI API key not available")
-def test_create_reminder_with_location():
+def test_create_reminder_with_location(client):
     """Test creating reminder with location."""
     response = client.post(
         "/reminders",
@@ -191,8 +351,7 @@ def test_create_reminder_with_location():
 
 # Test Get Reminders
 
-@pytest.mark.skipif(not os.getenv("OPENAI_API_KEY"), reason="OpenAI API key not available")
-def test_get_reminders_empty():
+def test_get_reminders_empty(client):
     """Test getting reminders when none exist."""
     response = client.get("/reminders", params={"user_id": TEST_USER_ID})
     assert response.status_code == 200
@@ -201,11 +360,10 @@ def test_get_reminders_empty():
     assert data["reminders"] == []
 
 
-@pytest.mark.skipif(not os.getenv("OPENAI_API_KEY"), reason="OpenAI API key not available")
-def test_get_reminders_after_create(sample_reminder_data):
+def test_get_reminders_after_create(client):
     """Test getting reminders after creating one."""
     # Create a reminder
-    create_response = client.post("/reminders", json=sample_reminder_data)
+    create_response = client.post("/reminders", content=_SAMPLE_BODY, headers=_JSON_HEADERS)
     assert create_response.status_code == 201
     
     # Get reminders
@@ -216,12 +374,10 @@ def test_get_reminders_after_create(sample_reminder_data):
     assert len(data["reminders"]) == 1
 
 
-@pytest.mark.skipif(not os.getenv("OPENAI_API_KEY"), reason="OpenAI API key not available")
-def test_get_reminders_with_pagination(sample_reminder_data):
+def test_get_reminders_with_pagination(client, db):
     """Test pagination."""
     # Create multiple reminders
-    for i in range(5):
-        client.post("/reminders", json=sample_reminder_data)
+    _seed(db, 5)
     
     # Get with pagination
     response = client.get("/reminders", params={"user_id": TEST_USER_ID, "page": 1, "page_size": 2})
@@ -235,12 +391,9 @@ def test_get_reminders_with_pagination(sample_reminder_data):
 
 # Test Get Single Reminder
 
-@pytest.mark.skipif(not os.getenv("OPENAI_API_KEY"), reason="OpenAI API key not available")
-def test_get_single_reminder(sample_reminder_data):
+def test_get_single_reminder(client, created_reminder):
     """Test getting a specific reminder."""
-    # Create a reminder
-    create_response = client.post("/reminders", json=sample_reminder_data)
-    reminder_id = create_response.json()["reminder"]["id"]
+    reminder_id = created_reminder["id"]
     
     # Get the reminder
     get_response = client.get(f"/reminders/{reminder_id}")
@@ -250,20 +403,17 @@ def test_get_single_reminder(sample_reminder_data):
     assert data["user_id"] == TEST_USER_ID
 
 
-def test_get_single_reminder_not_found():
+def test_get_single_reminder_not_found(client):
     """Test getting non-existent reminder."""
-    response = client.get("/reminders/00000000-0000-0000-0000-000000000000")
+    response = client.get(_MISSING_URL)
     assert response.status_code == 404
 
 
 # Test Update Reminder
 
-@pytest.mark.skipif(not os.getenv("OPENAI_API_KEY"), reason="OpenAI API key not available")
-def test_update_reminder_priority(sample_reminder_data):
+def test_update_reminder_priority(client, created_reminder):
     """Test updating reminder priority."""
-    # Create a reminder
-    create_response = client.post("/reminders", json=sample_reminder_data)
-    reminder_id = create_response.json()["reminder"]["id"]
+    reminder_id = created_reminder["id"]
     
     # Update priority
     update_response = client.put(
@@ -275,12 +425,9 @@ def test_update_reminder_priority(sample_reminder_data):
     assert data["priority"] == "high"
 
 
-@pytest.mark.skipif(not os.getenv("OPENAI_API_KEY"), reason="OpenAI API key not available")
-def test_update_reminder_tags(sample_reminder_data):
+def test_update_reminder_tags(client, created_reminder):
     """Test updating reminder tags."""
-    # Create a reminder
-    create_response = client.post("/reminders", json=sample_reminder_data)
-    reminder_id = create_response.json()["reminder"]["id"]
+    reminder_id = created_reminder["id"]
     
     # Update tags
     update_response = client.put(
@@ -293,10 +440,10 @@ def test_update_reminder_tags(sample_reminder_data):
     assert "family" in data["tags"]
 
 
-def test_update_reminder_not_found():
+def test_update_reminder_not_found(client):
     """Test updating non-existent reminder."""
     response = client.put(
-        "/reminders/00000000-0000-0000-0000-000000000000",
+        _MISSING_URL,
         json={"title": "Test"}
     )
     assert response.status_code == 404
@@ -304,12 +451,9 @@ def test_update_reminder_not_found():
 
 # Test Complete Reminder
 
-@pytest.mark.skipif(not os.getenv("OPENAI_API_KEY"), reason="OpenAI API key not available")
-def test_complete_reminder(sample_reminder_data):
+def test_complete_reminder(client, created_reminder):
     """Test completing a reminder."""
-    # Create a reminder
-    create_response = client.post("/reminders", json=sample_reminder_data)
-    reminder_id = create_response.json()["reminder"]["id"]
+    reminder_id = created_reminder["id"]
     
     # Complete the reminder
     complete_response = client.post(f"/reminders/{reminder_id}/complete")
@@ -319,20 +463,17 @@ def test_complete_reminder(sample_reminder_data):
     assert data["completed_at"] is not None
 
 
-def test_complete_reminder_not_found():
+def test_complete_reminder_not_found(client):
     """Test completing non-existent reminder."""
-    response = client.post("/reminders/00000000-0000-0000-0000-000000000000/complete")
+    response = client.post(_MISSING_COMPLETE_URL)
     assert response.status_code == 404
 
 
 # Test Delete Reminder
 
-@pytest.mark.skipif(not os.getenv("OPENAI_API_KEY"), reason="OpenAI API key not available")
-def test_delete_reminder(sample_reminder_data):
+def test_delete_reminder(client, created_reminder):
     """Test deleting a reminder."""
-    # Create a reminder
-    create_response = client.post("/reminders", json=sample_reminder_data)
-    reminder_id = create_response.json()["reminder"]["id"]
+    reminder_id = created_reminder["id"]
     
     # Delete the reminder
     delete_response = client.delete(f"/reminders/{reminder_id}")
@@ -345,21 +486,18 @@ def test_delete_reminder(sample_reminder_data):
     assert get_response.status_code == 404
 
 
-def test_delete_reminder_not_found():
+def test_delete_reminder_not_found(client):
     """Test deleting non-existent reminder."""
-    response = client.delete("/reminders/00000000-0000-0000-0000-000000000000")
+    response = client.delete(_MISSING_URL)
     assert response.status_code == 404
 
 
 # Test Filtering
 
-@pytest.mark.skipif(not os.getenv("OPENAI_API_KEY"), reason="OpenAI API key not available")
-def test_filter_by_status(sample_reminder_data):
+def test_filter_by_status(client, db):
     """Test filtering reminders by status."""
     # Create reminders
-    create_response = client.post("/reminders", json=sample_reminder_data)
-    reminder_id = create_response.json()["reminder"]["id"]
-    client.post("/reminders", json=sample_reminder_data)
+    reminder_id = _seed(db, 2)[0].id
     
     # Complete one
     client.post(f"/reminders/{reminder_id}/complete")
@@ -368,17 +506,16 @@ def test_filter_by_status(sample_reminder_data):
     response = client.get("/reminders", params={"user_id": TEST_USER_ID, "status": "pending"})
     assert response.status_code == 200
     data = response.json()
-    assert all(r["status"] == "pending" for r in data["reminders"])
+    assert {r["status"] for r in data["reminders"]} <= {"pending"}
     
     # Filter by completed
     response = client.get("/reminders", params={"user_id": TEST_USER_ID, "status": "completed"})
     assert response.status_code == 200
     data = response.json()
-    assert all(r["status"] == "completed" for r in data["reminders"])
+    assert {r["status"] for r in data["reminders"]} <= {"completed"}
 
 
-@pytest.mark.skipif(not os.getenv("OPENAI_API_KEY"), reason="OpenAI API key not available")
-def test_filter_by_priority():
+def test_filter_by_priority(client):
     """Test filtering reminders by priority."""
     # Create high priority reminder
     client.post(
@@ -405,11 +542,10 @@ def test_filter_by_priority():
     assert response.status_code == 200
 
 
-@pytest.mark.skipif(not os.getenv("OPENAI_API_KEY"), reason="OpenAI API key not available")
-def test_filter_by_tag(sample_reminder_data):
+def test_filter_by_tag(client):
     """Test filtering reminders by tag."""
     # Create a reminder
-    create_response = client.post("/reminders", json=sample_reminder_data)
+    create_response = client.post("/reminders", content=_SAMPLE_BODY, headers=_JSON_HEADERS)
     reminder_id = create_response.json()["reminder"]["id"]
     
     # Add specific tag
@@ -427,8 +563,7 @@ def test_filter_by_tag(sample_reminder_data):
 
 # Test Due Reminders
 
-@pytest.mark.skipif(not os.getenv("OPENAI_API_KEY"), reason="OpenAI API key not available")
-def test_get_due_reminders():
+def test_get_due_reminders(client):
     """Test getting due reminders."""
     # Create a past-due reminder
     client.post(
@@ -450,7 +585,7 @@ def test_get_due_reminders():
 
 # Test Error Handling
 
-def test_create_reminder_invalid_data():
+def test_create_reminder_invalid_data(client):
     """Test creating reminder with invalid data."""
     response = client.post(
         "/reminders",
@@ -459,7 +594,7 @@ def test_create_reminder_invalid_data():
     assert response.status_code == 422  # Validation error
 
 
-def test_parse_only_empty_input():
+def test_parse_only_empty_input(client):
     """Test parsing with empty input."""
     response = client.post(
         "/reminders/parse",
@@ -471,13 +606,3 @@ def test_parse_only_empty_input():
     # Should either fail validation or return error
     assert response.status_code in [400, 422, 500]
 
-
-# Cleanup
-
-@pytest.fixture(scope="session", autouse=True)
-def cleanup_test_db():
-    """Cleanup test database after all tests."""
-    yield
-    import os
-    if os.path.exists("./test_reminders.db"):
-        os.remove("./test_reminders.db")
@@ -5,8 +5,11 @@ Tests CRUD functionality for the Reminder model.
 
 import pytest
 from datetime import datetime, timedelta
-from database import SessionLocal, init_db
-from models import Reminder
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import SingletonThreadPool
+from database import DATABASE_URL, init_db
+from tests.conftest import configure_savepoint_engine, set_sqlite_pragmas
 from crud import (
     create_reminder,
     get_reminder,
@@ -15,36 +18,60 @@ from crud import (
     update_reminder,
     complete_reminder,
     delete_reminder,
-    get_due_reminders
+    get_due_reminders,
+    claim_due_reminders
 )
 
 
+# One connection per thread: the file and its WAL are opened once, and since
+# these tests do not exercise concurrency, serialized writes cost nothing
+test_engine = create_engine(
+    DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=SingletonThreadPool,
+)
+event.listen(test_engine, "connect", set_sqlite_pragmas)
+configure_savepoint_engine(test_engine)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup_database():
+    """Make sure the schema exists before any test runs."""
+    init_db()
+
+
 @pytest.fixture(scope="function")
 def db_session():
-    """Create a test database session."""
-    init_db()
-    db = SessionLocal()
+    """
+    Create a test database session inside a transaction that is rolled back.
     
-    # Clean up any existing test data
-    db.query(Reminder).filter(Reminder.user_id == "test_user").delete()
-    db.commit()
+    CRUD commits become SAVEPOINT releases, so no cleanup queries are needed.
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    db = Session(bind=connection, join_transaction_mode="create_savepoint")
     
     yield db
     
-    # Clean up after test
-    db.query(Reminder).filter(Reminder.user_id == "test_user").delete()
-    db.commit()
     db.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def now():
+    """Reference time for building due dates, read once per test."""
+    return datetime.utcnow()
 
 
-def test_create_reminder(db_session):
+def test_create_reminder(db_session, now):
     """Test creating a reminder."""
     
     reminder = create_reminder(
         db=db_session,
         user_id="test_user",
         title="Test Reminder",
-        due_date_time=datetime.utcnow() + timedelta(days=1),
+        due_date_time=now + timedelta(days=1),
         timezone="UTC",
         priority="high",
         tags=["test", "demo"]
@@ -61,7 +88,7 @@ def test_create_reminder(db_session):
     print(f"✅ test_create_reminder passed - Created reminder: {reminder.id[:8]}")
 
 
-def test_read_reminders(db_session):
+def test_read_reminders(db_session, now):
     """Test reading reminders."""
     
     # Create test reminders
@@ -70,7 +97,7 @@ def test_read_reminders(db_session):
             db=db_session,
             user_id="test_user",
             title=f"Reminder {i}",
-            due_date_time=datetime.utcnow() + timedelta(days=i+1),
+            due_date_time=now + timedelta(days=i+1),
             timezone="UTC"
         )
     
@@ -83,7 +110,7 @@ def test_read_reminders(db_session):
     print(f"✅ test_read_reminders passed - Found {len(reminders)} reminders")
 
 
-def test_read_reminders_by_status(db_session):
+def test_read_reminders_by_status(db_session, now):
     """Test filtering reminders by status."""
     
     # Create active reminder
@@ -91,7 +118,7 @@ def test_read_reminders_by_status(db_session):
         db=db_session,
         user_id="test_user",
         title="Active Reminder",
-        due_date_time=datetime.utcnow() + timedelta(days=1),
+        due_date_time=now + timedelta(days=1),
         timezone="UTC"
     )
     
@@ -100,7 +127,7 @@ def test_read_reminders_by_status(db_session):
         db=db_session,
         user_id="test_user",
         title="Completed Reminder",
-        due_date_time=datetime.utcnow() + timedelta(days=2),
+        due_date_time=now + timedelta(days=2),
         timezone="UTC"
     )
     complete_reminder(db_session, reminder2.id)
@@ -117,14 +144,14 @@ def test_read_reminders_by_status(db_session):
     print(f"✅ test_read_reminders_by_status passed - Active: {len(active)}, Completed: {len(completed)}")
 
 
-def test_update_reminder(db_session):
+def test_update_reminder(db_session, now):
     """Test updating a reminder."""
     
     reminder = create_reminder(
         db=db_session,
         user_id="test_user",
         title="Original Title",
-        due_date_time=datetime.utcnow() + timedelta(days=1),
+        due_date_time=now + timedelta(days=1),
         timezone="UTC",
         priority="medium"
     )
@@ -149,14 +176,14 @@ def test_update_reminder(db_session):
     print(f"✅ test_update_reminder passed - Updated reminder: {updated.title}")
 
 
-def test_complete_reminder(db_session):
+def test_complete_reminder(db_session, now):
     """Test completing a reminder."""
     
     reminder = create_reminder(
         db=db_session,
         user_id="test_user",
         title="Task to Complete",
-        due_date_time=datetime.utcnow() + timedelta(days=1),
+        due_date_time=now + timedelta(days=1),
         timezone="UTC"
     )
     
@@ -171,14 +198,14 @@ def test_complete_reminder(db_session):
     print(f"✅ test_complete_reminder passed - Completed: {completed.title}")
 
 
-def test_delete_reminder(db_session):
+def test_delete_reminder(db_session, now):
     """Test deleting a reminder."""
     
     reminder = create_reminder(
         db=db_session,
         user_id="test_user",
         title="To Be Deleted",
-        due_date_time=datetime.utcnow() + timedelta(days=1),
+        due_date_time=now + timedelta(days=1),
         timezone="UTC"
     )
     
@@ -196,14 +223,14 @@ def test_delete_reminder(db_session):
     print(f"✅ test_delete_reminder passed - Deleted reminder: {reminder_id[:8]}")
 
 
-def test_get_specific_reminder(db_session):
+def test_get_specific_reminder(db_session, now):
     """Test getting a specific reminder by ID."""
     
     reminder = create_reminder(
         db=db_session,
         user_id="test_user",
         title="Specific Reminder",
-        due_date_time=datetime.utcnow() + timedelta(days=1),
+        due_date_time=now + timedelta(days=1),
         timezone="UTC"
     )
     
@@ -216,14 +243,14 @@ def test_get_specific_reminder(db_session):
     print(f"✅ test_get_specific_reminder passed - Retrieved: {fetched.title}")
 
 
-def test_get_reminders_by_tag(db_session):
+def test_get_reminders_by_tag(db_session, now):
     """Test filtering reminders by tag."""
     
     create_reminder(
         db=db_session,
         user_id="test_user",
         title="Work Task",
-        due_date_time=datetime.utcnow() + timedelta(days=1),
+        due_date_time=now + timedelta(days=1),
         timezone="UTC",
         tags=["work", "important"]
     )
@@ -232,7 +259,7 @@ def test_get_reminders_by_tag(db_session):
         db=db_session,
         user_id="test_user",
         title="Personal Task",
-        due_date_time=datetime.utcnow() + timedelta(days=2),
+        due_date_time=now + timedelta(days=2),
         timezone="UTC",
         tags=["personal"]
     )
@@ -247,11 +274,9 @@ def test_get_reminders_by_tag(db_session):
     print(f"✅ test_get_reminders_by_tag passed - Work: {len(work_reminders)}, Personal: {len(personal_reminders)}")
 
 
-def test_get_due_reminders(db_session):
+def test_get_due_reminders(db_session, now):
     """Test getting reminders due in a time range."""
     
-    now = datetime.utcnow()
-    
     # Create reminders at different times
     create_reminder(
         db=db_session,
@@ -279,14 +304,50 @@ def test_get_due_reminders(db_session):
     print(f"✅ test_get_due_reminders passed - Found {len(due_soon)} reminders due soon")
 
 
-def test_reminder_with_recurrence(db_session):
+def test_claim_due_reminders(db_session, now):
+    """Test claiming due reminders marks them notified exactly once."""
+    
+    create_reminder(
+        db=db_session,
+        user_id="test_user",
+        title="Due Soon",
+        due_date_time=now + timedelta(minutes=3),
+        timezone="UTC"
+    )
+    
+    create_reminder(
+        db=db_session,
+        user_id="test_user",
+        title="Due Later",
+        due_date_time=now + timedelta(days=2),
+        timezone="UTC"
+    )
+    
+    window = timedelta(minutes=5)
+    claimed = claim_due_reminders(db_session, now, now + window, notified_at=now)
+    db_session.commit()
+    claimed = [r for r in claimed if r.user_id == "test_user"]
+    
+    assert [r.title for r in claimed] == ["Due Soon"]
+    assert claimed[0].last_notified_at == now
+    
+    # The next tick's overlapping window must not claim it again
+    next_tick = now + timedelta(minutes=1)
+    reclaimed = claim_due_reminders(db_session, next_tick, next_tick + window, notified_at=next_tick)
+    db_session.commit()
+    assert not [r for r in reclaimed if r.user_id == "test_user"]
+    
+    print(f"✅ test_claim_due_reminders passed - Claimed {len(claimed)} reminder once")
+
+
+def test_reminder_with_recurrence(db_session, now):
     """Test creating a recurring reminder."""
     
     reminder = create_reminder(
         db=db_session,
         user_id="test_user",
         title="Weekly Meeting",
-        due_date_time=datetime.utcnow() + timedelta(days=1),
+        due_date_time=now + timedelta(days=1),
         timezone="UTC",
         is_recurring=True,
         recurrence_pattern={
@@ -5,27 +5,35 @@ Tests natural language parsing functionality.
 
 import pytest
 import os
+import json
+import asyncio
+from types import SimpleNamespace
 from datetime import datetime, timedelta
+from openai import OpenAI
+import openai_service
 from openai_service import (
     parse_reminder,
     parse_reminder_batch,
+    parse_reminder_batch_async,
     validate_parsed_reminder,
-    calculate_confidence
+    calculate_confidence,
+    select_model
 )
 
 
-@pytest.fixture
-def openai_available():
-    """Check if OpenAI API key is available."""
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key or api_key == "sk-your-key-here":
-        pytest.skip("OpenAI API key not available - skipping OpenAI tests")
+@pytest.fixture(scope="module")
+def oai_client():
+    """One OpenAI client shared by the API-calling tests in this module."""
+    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    yield client
+    client.close()
 
 
-def test_parse_simple_reminder(openai_available):
+@pytest.mark.openai
+def test_parse_simple_reminder(oai_client):
     """Test parsing a simple time-based reminder."""
     
-    result = parse_reminder("Remind me to call John tomorrow at 3pm")
+    result = parse_reminder("Remind me to call John tomorrow at 3pm", client=oai_client)
     parsed = result['parsed']
     
     # Check required fields exist
@@ -42,10 +50,11 @@ def test_parse_simple_reminder(openai_available):
     print(f"✅ test_parse_simple_reminder passed - Title: {parsed['title']}")
 
 
-def test_parse_urgent_reminder(openai_available):
+@pytest.mark.openai
+def test_parse_urgent_reminder(oai_client):
     """Test detecting urgency from keywords."""
     
-    result = parse_reminder("URGENT: Submit report by end of day")
+    result = parse_reminder("URGENT: Submit report by end of day", client=oai_client)
     parsed = result['parsed']
     
     # Should detect high or urgent priority
@@ -57,10 +66,11 @@ def test_parse_urgent_reminder(openai_available):
     print(f"✅ test_parse_urgent_reminder passed - Priority: {parsed['priority']}")
 
 
-def test_parse_recurring_reminder(openai_available):
+@pytest.mark.openai
+def test_parse_recurring_reminder(oai_client):
     """Test parsing recurring patterns."""
     
-    result = parse_reminder("Team meeting every Monday at 9am")
+    result = parse_reminder("Team meeting every Monday at 9am in Conference Room B", client=oai_client)
     parsed = result['parsed']
     
     # Should detect recurring pattern
@@ -71,12 +81,14 @@ def test_parse_recurring_reminder(openai_available):
     print(f"✅ test_parse_recurring_reminder passed - Recurring: {parsed['recurrence_pattern']['frequency']}")
 
 
-def test_parse_with_timezone(openai_available):
+@pytest.mark.openai
+def test_parse_with_timezone(oai_client):
     """Test timezone handling."""
     
     result = parse_reminder(
         "Meeting tomorrow at 2pm",
-        user_timezone="America/Los_Angeles"
+        user_timezone="America/Los_Angeles",
+        client=oai_client
     )
     parsed = result['parsed']
     
@@ -84,16 +96,17 @@ def test_parse_with_timezone(openai_available):
     assert parsed['timezone'] is not None
     
     # Due date should be parseable
-    due_date = datetime.fromisoformat(parsed['due_date_time'].replace('Z', '+00:00'))
+    due_date = datetime.fromisoformat(parsed['due_date_time'])
     assert due_date is not None
     
     print(f"✅ test_parse_with_timezone passed - Timezone: {parsed['timezone']}")
 
 
-def test_parse_with_location(openai_available):
+@pytest.mark.openai
+def test_parse_with_location(oai_client):
     """Test extracting location information."""
     
-    result = parse_reminder("Doctor appointment at City Hospital tomorrow at 2pm")
+    result = parse_reminder("Doctor appointment at City Hospital tomorrow at 2pm", client=oai_client)
     parsed = result['parsed']
     
     # Should extract location if mentioned
@@ -103,10 +116,11 @@ def test_parse_with_location(openai_available):
     print(f"✅ test_parse_with_location passed - Location: {parsed.get('location', 'Not detected')}")
 
 
-def test_parse_with_tags(openai_available):
+@pytest.mark.openai
+def test_parse_with_tags(oai_client):
     """Test automatic tag generation."""
     
-    result = parse_reminder("Team standup meeting tomorrow morning")
+    result = parse_reminder("Team standup meeting tomorrow morning", client=oai_client)
     parsed = result['parsed']
     
     # Should generate relevant tags
@@ -119,7 +133,8 @@ def test_parse_with_tags(openai_available):
     print(f"✅ test_parse_with_tags passed - Tags: {', '.join(parsed.get('tags', []))}")
 
 
-def test_parse_relative_time(openai_available):
+@pytest.mark.openai
+def test_parse_relative_time():
     """Test parsing relative time expressions."""
     
     test_cases = [
@@ -128,15 +143,18 @@ def test_parse_relative_time(openai_available):
         "Submit report by Friday"
     ]
     
-    for input_text in test_cases:
-        result = parse_reminder(input_text)
+    # One concurrent batch instead of a round-trip per case
+    results = parse_reminder_batch(test_cases)
+    
+    for result in results:
+        assert 'error' not in result, result.get('error')
         parsed = result['parsed']
         
         # Should have a valid due date
         assert parsed['due_date_time'] is not None
         
         # Should be parseable as ISO 8601
-        due_date = datetime.fromisoformat(parsed['due_date_time'].replace('Z', '+00:00'))
+        due_date = datetime.fromisoformat(parsed['due_date_time'])
         assert due_date is not None
         
         # Should be in the future (for most cases)
@@ -145,10 +163,11 @@ def test_parse_relative_time(openai_available):
     print(f"✅ test_parse_relative_time passed - Tested {len(test_cases)} cases")
 
 
-def test_parse_daily_recurring(openai_available):
+@pytest.mark.openai
+def test_parse_daily_recurring(oai_client):
     """Test parsing daily recurring reminders."""
     
-    result = parse_reminder("Take medication every day at 8am")
+    result = parse_reminder("Take medication every day at 8am with breakfast", client=oai_client)
     parsed = result['parsed']
     
     assert parsed['is_recurring'] == True
@@ -204,6 +223,381 @@ def test_validate_parsed_reminder_invalid_priority():
     print(f"✅ test_validate_parsed_reminder_invalid_priority passed")
 
 
+def test_parse_cache_reuses_normalized_input(monkeypatch):
+    """Test repeated input on the same day is served from the parse cache."""
+    
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    now = datetime(2025, 10, 22, 9, 0)
+    parsed = {
+        "title": "Call mom",
+        "due_date_time": "2025-10-23T09:00:00",
+        "priority": "medium",
+        "is_recurring": False
+    }
+    cache_key = openai_service._cache_key("Call mom tomorrow", "UTC", now)
+    openai_service._store_cached_result(cache_key, {
+        "parsed": parsed,
+        "original_input": "Call mom tomorrow",
+        "confidence": 0.8,
+        "model_used": "gpt-4o-mini"
+    })
+    
+    result = parse_reminder("  call MOM   tomorrow ", current_time=now)
+    assert result["parsed"] == parsed
+    assert result["original_input"] == "  call MOM   tomorrow "
+    
+    # Inputs relative to the current instant are never cached
+    assert openai_service._cache_key("Call mom in 2 hours", "UTC", now) is None
+    
+    print(f"✅ test_parse_cache_reuses_normalized_input passed")
+
+
+def test_select_model_routes_by_complexity():
+    """Test simple inputs use the small model and complex ones the large model."""
+    
+    assert select_model("Call John tomorrow at 3pm") == "gpt-4o-mini"
+    assert select_model("Team standup every Monday, Wednesday, and Friday at 9am") == "gpt-4o"
+    assert select_model("Pay rent on the first unless it falls on a weekend") == "gpt-4o"
+    
+    print(f"✅ test_select_model_routes_by_complexity passed")
+
+
+def test_parse_fast_path_recurring(monkeypatch):
+    """Test simple recurring reminders are parsed locally without an API key."""
+    
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    now = datetime(2025, 10, 22, 9, 0)  # Wednesday
+    
+    daily = parse_reminder("Take medication every day at 8am", current_time=now)
+    assert daily["model_used"] == openai_service.FAST_PATH_MODEL
+    assert daily["confidence"] == 0.95
+    assert daily["parsed"]["title"] == "Take medication"
+    assert daily["parsed"]["due_date_time"] == "2025-10-23T08:00:00"
+    assert daily["parsed"]["recurrence_pattern"]["frequency"] == "daily"
+    
+    weekly = parse_reminder("Team meeting every Monday at 9:30 PM", current_time=now)
+    assert weekly["parsed"]["due_date_time"] == "2025-10-27T21:30:00"
+    assert weekly["parsed"]["recurrence_pattern"]["frequency"] == "weekly"
+    assert weekly["parsed"]["recurrence_pattern"]["days_of_week"] == [0]
+    is_valid, error = validate_parsed_reminder(weekly["parsed"])
+    assert is_valid, error
+    
+    # "Remind me (to)" is dropped and the title capitalized, as the model would
+    reminded = parse_reminder("remind me to call mom every sunday at 6pm", current_time=now)
+    assert reminded["parsed"]["title"] == "Call mom"
+    assert reminded["parsed"]["due_date_time"] == "2025-10-26T18:00:00"
+    reminded = parse_reminder("Remind me to take medication every day at 8am", current_time=now)
+    assert reminded["parsed"]["title"] == "Take medication"
+    
+    # Anything outside the pattern still needs OpenAI
+    for natural_input in ("Urgent: pay rent every Monday at 9am",
+                          "Standup every Monday at 9am until December",
+                          "Gym every day at 13pm",
+                          "Remind me every day at 8am"):
+        with pytest.raises(ValueError, match="API key not configured"):
+            parse_reminder(natural_input, current_time=now)
+    
+    print(f"✅ test_parse_fast_path_recurring passed")
+
+
+def test_parse_batch_without_api_key(monkeypatch):
+    """Test a batch resolves fast-path inputs and reports per-input errors without a key."""
+    
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    inputs = ["Take medication every day at 8am", "Call client next week", ""]
+    
+    results = parse_reminder_batch(inputs)
+    
+    assert [r["original_input"] for r in results] == inputs
+    assert results[0]["model_used"] == openai_service.FAST_PATH_MODEL
+    assert results[0]["parsed"]["recurrence_pattern"]["frequency"] == "daily"
+    assert results[1]["parsed"] is None
+    assert "API key not configured" in results[1]["error"]
+    assert results[2]["parsed"] is None
+    assert "cannot be empty" in results[2]["error"]
+    
+    print(f"✅ test_parse_batch_without_api_key passed")
+
+
+def test_parse_batch_from_running_event_loop(monkeypatch):
+    """Test async callers await the batch coroutine; the sync wrapper refuses to run inside a loop."""
+    
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    inputs = ["Take medication every day at 8am", "Call client next week"]
+    
+    async def call_from_async_code():
+        results = await parse_reminder_batch_async(inputs)
+        with pytest.raises(RuntimeError, match="await parse_reminder_batch_async"):
+            parse_reminder_batch(inputs)
+        return results
+    
+    results = asyncio.run(call_from_async_code())
+    
+    assert results[0]["model_used"] == openai_service.FAST_PATH_MODEL
+    assert "API key not configured" in results[1]["error"]
+    
+    print(f"✅ test_parse_batch_from_running_event_loop passed")
+
+
+def _completion_body(arguments: dict) -> dict:
+    """Chat completion response body carrying one create_reminder tool call."""
+    return {
+        "id": "chatcmpl-test",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-4o-mini",
+        "choices": [{
+            "index": 0,
+            "finish_reason": "tool_calls",
+            "message": {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [{
+                    "id": "call_test",
+                    "type": "function",
+                    "function": {"name": "create_reminder", "arguments": json.dumps(arguments)}
+                }]
+            }
+        }]
+    }
+
+
+class _FakeBatchClient:
+    """Records Batch API uploads and serves canned batches and result files."""
+    
+    def __init__(self, batch=None, files=None):
+        self.uploads = []
+        self.batch = batch
+        self.file_texts = files or {}
+        self.files = SimpleNamespace(create=self._create_file, content=self._file_content)
+        self.batches = SimpleNamespace(create=self._create_batch, retrieve=self._retrieve_batch)
+    
+    def _create_file(self, file, purpose):
+        self.uploads.append((file, purpose))
+        return SimpleNamespace(id="file-input")
+    
+    def _file_content(self, file_id):
+        return SimpleNamespace(text=self.file_texts[file_id])
+    
+    def _create_batch(self, input_file_id, endpoint, completion_window):
+        self.batch_request = (input_file_id, endpoint, completion_window)
+        return SimpleNamespace(id="batch-123")
+    
+    def _retrieve_batch(self, batch_id):
+        return self.batch
+
+
+def test_submit_batch_uploads_one_request_per_input(monkeypatch):
+    """Test submit_batch uploads a JSONL request per input, keyed by index."""
+    
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    fake = _FakeBatchClient()
+    monkeypatch.setattr(openai_service, "get_client", lambda: fake)
+    inputs = ["Call mom tomorrow at 3pm", "Team standup every Monday, Wednesday, and Friday at 9am"]
+    
+    batch_id = openai_service.submit_batch(inputs, completion_window="24h")
+    
+    assert batch_id == "batch-123"
+    assert fake.batch_request == ("file-input", "/v1/chat/completions", "24h")
+    (filename, content), purpose = fake.uploads[0]
+    assert purpose == "batch"
+    records = [json.loads(line) for line in content.decode("utf-8").splitlines()]
+    assert [r["custom_id"] for r in records] == ["0", "1"]
+    assert all(r["url"] == "/v1/chat/completions" for r in records)
+    assert records[0]["body"]["messages"][-1]["content"] == inputs[0]
+    assert records[1]["body"]["model"] == openai_service.COMPLEX_MODEL
+    
+    # Inputs are checked before anything is uploaded
+    with pytest.raises(ValueError, match="cannot be empty"):
+        openai_service.submit_batch(["Call mom", " "])
+    assert len(fake.uploads) == 1
+    
+    print(f"✅ test_submit_batch_uploads_one_request_per_input passed")
+
+
+def test_retrieve_batch_maps_results_to_inputs(monkeypatch):
+    """Test retrieve_batch merges output and error files back into input order."""
+    
+    arguments = {
+        "title": "Call mom",
+        "due_date_time": "2025-10-23T15:00:00",
+        "priority": "medium",
+        "is_recurring": False
+    }
+    output_lines = [
+        # Out of order on purpose: results are matched by custom_id
+        {"custom_id": "2", "response": {"status_code": 400, "body": {"error": {"message": "bad request"}}}},
+        {"custom_id": "0", "response": {"status_code": 200, "body": _completion_body(arguments)}},
+    ]
+    error_lines = [
+        {"custom_id": "1", "response": None, "error": {"code": "server_error", "message": "boom"}},
+    ]
+    batch = SimpleNamespace(status="completed", output_file_id="file-out", error_file_id="file-err")
+    fake = _FakeBatchClient(batch, {
+        "file-out": "\n".join(json.dumps(line) for line in output_lines) + "\n",
+        "file-err": "\n".join(json.dumps(line) for line in error_lines),
+    })
+    monkeypatch.setattr(openai_service, "get_client", lambda: fake)
+    inputs = ["Call mom tomorrow at 3pm", "Dentist next week", "Gym tonight", "Never answered"]
+    
+    results = openai_service.retrieve_batch("batch-123", inputs)
+    
+    assert [r["original_input"] for r in results] == inputs
+    assert results[0]["parsed"] == arguments
+    assert results[0]["model_used"] == "gpt-4o-mini"
+    assert "server_error" in results[1]["error"]
+    assert "bad request" in results[2]["error"]
+    assert "No result returned" in results[3]["error"]
+    assert all(r["parsed"] is None and r["confidence"] == 0.0 for r in results[1:])
+    
+    print(f"✅ test_retrieve_batch_maps_results_to_inputs passed")
+
+
+def test_retrieve_batch_pending_and_failed(monkeypatch):
+    """Test retrieve_batch returns None while running and raises once the batch failed."""
+    
+    fake = _FakeBatchClient()
+    monkeypatch.setattr(openai_service, "get_client", lambda: fake)
+    
+    for status in ("validating", "in_progress", "finalizing"):
+        fake.batch = SimpleNamespace(status=status)
+        assert openai_service.retrieve_batch("batch-123", ["Call mom"]) is None
+    
+    for status in ("failed", "expired", "cancelled"):
+        fake.batch = SimpleNamespace(status=status)
+        with pytest.raises(Exception, match=f"ended with status: {status}"):
+            openai_service.retrieve_batch("batch-123", ["Call mom"])
+    
+    print(f"✅ test_retrieve_batch_pending_and_failed passed")
+
+
+def _stream_chunk(arguments=None, model="gpt-4o-mini-2024-07-18"):
+    """Streamed completion chunk, carrying a tool-call arguments fragment if given."""
+    tool_calls = [SimpleNamespace(function=SimpleNamespace(arguments=arguments))] if arguments is not None else None
+    return SimpleNamespace(
+        model=model,
+        choices=[SimpleNamespace(delta=SimpleNamespace(tool_calls=tool_calls))],
+        usage=None
+    )
+
+
+class _FakeStream:
+    """Completion stream over canned chunks that records close() and how far it was read."""
+    
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.consumed = 0
+        self.closed = False
+    
+    def __iter__(self):
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield chunk
+    
+    def close(self):
+        self.closed = True
+
+
+def _fake_stream_client(stream):
+    """OpenAI client stand-in whose chat.completions.create returns the given stream."""
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=lambda **kwargs: stream)))
+
+
+# Braces and escaped quotes inside strings must not end the object early
+_STREAMED_ARGUMENTS = json.dumps({
+    "title": 'Fix "}" in {config} \\ and say "done"',
+    "due_date_time": "2025-10-23T15:00:00",
+    "priority": "medium",
+    "is_recurring": True,
+    "recurrence_pattern": {"frequency": "weekly", "interval": 1, "days_of_week": [0, 2]},
+    "tags": ["work", "[misc]"]
+})
+
+
+def test_arguments_buffer_finds_closing_brace():
+    """Test the streaming scanner ignores braces and escaped quotes inside strings."""
+    
+    for size in (1, 3, 7, len(_STREAMED_ARGUMENTS)):
+        fragments = [_STREAMED_ARGUMENTS[i:i + size] for i in range(0, len(_STREAMED_ARGUMENTS), size)]
+        buffer = openai_service._ArgumentsBuffer()
+        
+        closed = [buffer.feed(fragment) for fragment in fragments]
+        
+        assert closed == [False] * (len(fragments) - 1) + [True]
+        assert json.loads(buffer.text()) == json.loads(_STREAMED_ARGUMENTS)
+    
+    print(f"✅ test_arguments_buffer_finds_closing_brace passed")
+
+
+def test_stream_tool_arguments_drains_after_closing_brace():
+    """Test fragments after the closing brace are ignored but the stream is read to the end."""
+    
+    fragments = [_STREAMED_ARGUMENTS[i:i + 5] for i in range(0, len(_STREAMED_ARGUMENTS), 5)]
+    stream = _FakeStream(
+        [_stream_chunk()]
+        + [_stream_chunk(fragment) for fragment in fragments]
+        + [_stream_chunk(" "), _stream_chunk()]  # trailing fragment and finish chunk
+    )
+    
+    arguments, model = openai_service._stream_tool_arguments(
+        {"model": "gpt-4o-mini"}, _fake_stream_client(stream)
+    )
+    
+    assert arguments == _STREAMED_ARGUMENTS
+    assert model == "gpt-4o-mini-2024-07-18"
+    # Reading to EOF lets the HTTP connection go back to the pool
+    assert stream.consumed == len(stream.chunks)
+    assert stream.closed
+    
+    print(f"✅ test_stream_tool_arguments_drains_after_closing_brace passed")
+
+
+def test_parse_reminder_stream_without_complete_arguments(monkeypatch):
+    """Test truncated or missing tool-call arguments fail cleanly and close the stream."""
+    
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    
+    truncated = _FakeStream([_stream_chunk(_STREAMED_ARGUMENTS[:40]), _stream_chunk()])
+    with pytest.raises(Exception, match="Failed to parse reminder with OpenAI"):
+        parse_reminder("Fix the config tomorrow", client=_fake_stream_client(truncated))
+    assert truncated.closed
+    
+    empty = _FakeStream([_stream_chunk(), _stream_chunk()])
+    with pytest.raises(Exception, match="No tool call returned"):
+        parse_reminder("Fix the config tomorrow", client=_fake_stream_client(empty))
+    assert empty.closed
+    
+    print(f"✅ test_parse_reminder_stream_without_complete_arguments passed")
+
+
+def test_stream_tool_arguments_logs_usage_when_debugging(caplog):
+    """Test debug logging requests stream usage and logs cached prompt tokens."""
+    
+    usage = SimpleNamespace(prompt_tokens=1200, prompt_tokens_details=SimpleNamespace(cached_tokens=1024))
+    stream = _FakeStream([
+        _stream_chunk(_STREAMED_ARGUMENTS),
+        _stream_chunk(),
+        SimpleNamespace(model="gpt-4o-mini-2024-07-18", choices=[], usage=usage)
+    ])
+    requests = []
+    
+    def create(**kwargs):
+        requests.append(kwargs)
+        return stream
+    
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    with caplog.at_level("DEBUG", logger="openai_service"):
+        arguments, _ = openai_service._stream_tool_arguments({"model": "gpt-4o-mini"}, client)
+    
+    assert arguments == _STREAMED_ARGUMENTS
+    assert requests[0]["stream_options"] == {"include_usage": True}
+    assert stream.consumed == 3
+    assert stream.closed
+    assert "OpenAI prompt tokens: 1200 (1024 cached)" in caplog.text
+    
+    print(f"✅ test_stream_tool_arguments_logs_usage_when_debugging passed")
+
+
 def test_calculate_confidence_time_specific():
     """Test confidence calculation with specific time."""
     
@@ -232,7 +626,8 @@ def test_calculate_confidence_vague():
     print(f"✅ test_calculate_confidence_vague passed - Confidence: {confidence:.2%}")
 
 
-def test_parse_reminder_batch(openai_available):
+@pytest.mark.openai
+def test_parse_reminder_batch():
     """Test batch parsing of multiple reminders."""
     
     inputs = [
@@ -284,10 +679,11 @@ def test_error_handling_no_api_key():
     print(f"✅ test_error_handling_no_api_key passed")
 
 
-def test_parse_weekly_specific_days(openai_available):
+@pytest.mark.openai
+def test_parse_weekly_specific_days(oai_client):
     """Test parsing weekly reminders on specific days."""
     
-    result = parse_reminder("Team standup every Monday, Wednesday, and Friday at 9am")
+    result = parse_reminder("Team standup every Monday, Wednesday, and Friday at 9am", client=oai_client)
     parsed = result['parsed']
     
     if parsed['is_recurring'] and parsed['recurrence_pattern']:
@@ -299,10 +695,11 @@ def test_parse_weekly_specific_days(openai_available):
     print(f"✅ test_parse_weekly_specific_days passed")
 
 
-def test_parse_end_of_day(openai_available):
+@pytest.mark.openai
+def test_parse_end_of_day(oai_client):
     """Test parsing 'end of day' expressions."""
     
-    result = parse_reminder("Submit timesheet by end of day Friday")
+    result = parse_reminder("Submit timesheet by end of day Friday", client=oai_client)
     parsed = result['parsed']
     
     # Should parse successfully
@@ -310,7 +707,7 @@ def test_parse_end_of_day(openai_available):
     assert parsed['due_date_time'] is not None
     
     # Due time should be in the evening (after 5pm)
-    due_date = datetime.fromisoformat(parsed['due_date_time'].replace('Z', '+00:00'))
+    due_date = datetime.fromisoformat(parsed['due_date_time'])
     assert due_date.hour >= 17 or due_date.hour == 0  # Evening or end of day
     
     print(f"✅ test_parse_end_of_day passed - Due: {parsed['due_date_time']}")